@@ -9,6 +9,12 @@ from pathlib import Path
 
 from ..models.workflow import N8nWorkflow, N8nNode, NodePosition
 
+# orjson parses workflow exports faster when installed; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,8 +124,9 @@ class WorkflowProcessor:
             raise WorkflowProcessorError(f"Workflow '{workflow_name}' not found in vault: {workflow_path}")
         
         try:
-            with open(workflow_path, 'r', encoding='utf-8') as f:
-                workflow_data = json.load(f)
+            raw = workflow_path.read_bytes()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+            workflow_data = orjson.loads(raw) if orjson else json.loads(raw)
             
             # Validate JSON structure
             errors = self.validate_workflow_json(workflow_data)
@@ -459,6 +466,11 @@ class WorkflowProcessor:
             workflow: Workflow to save
             output_path: Output file path
         """
+        self._save_workflow_impl(workflow, output_path)
+    
+    @staticmethod
+    def _save_workflow_impl(workflow: N8nWorkflow, output_path: Path) -> None:
+        """Write workflow JSON to disk; needs no processor state."""
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
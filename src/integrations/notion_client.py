@@ -1,11 +1,12 @@
 """Notion API integration client with database operations support."""
 
 import os
+import math
 import time
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from notion_client import Client, APIErrorCode, APIResponseError
-from notion_client.helpers import collect_paginated_api
+from notion_client.helpers import iterate_paginated_api
 
 from ..models.notion import NotionDatabase, NotionBusinessOS
 from ..models.package import AutomationPackage
@@ -25,13 +26,15 @@ class NotionClient:
     Business OS integration following patterns from ramnes/notion-sdk-py.
     """
     
-    def __init__(self, auth_token: Optional[str] = None, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(self, auth_token: Optional[str] = None, max_retries: int = 3, retry_delay: float = 1.0,
+                 max_delay: float = 60.0):
         """Initialize Notion client.
         
         Args:
             auth_token: Notion API token (defaults to NOTION_TOKEN env var)
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
+            max_delay: Upper bound in seconds on a server-requested Retry-After
         """
         token = auth_token or os.environ.get("NOTION_TOKEN")
         if not token:
@@ -40,6 +43,7 @@ class NotionClient:
         self.client = Client(auth=token)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_delay = max_delay
         self._workspace_id: Optional[str] = None
     
     def _retry_with_backoff(self, operation, *args, **kwargs):
@@ -57,8 +61,10 @@ class NotionClient:
                     raise e
                 
                 if attempt < self.max_retries:
-                    # Exponential backoff with jitter
-                    delay = self.retry_delay * (2 ** attempt) * (0.5 + 0.5 * time.time() % 1)
+                    # Honor the server's Retry-After, else exponential backoff with jitter
+                    delay = self._retry_after_seconds(e)
+                    if delay is None:
+                        delay = self.retry_delay * (2 ** attempt) * (0.5 + 0.5 * time.time() % 1)
                     logger.warning(f"Notion API error on attempt {attempt + 1}: {e}. Retrying in {delay:.2f}s")
                     time.sleep(delay)
                 else:
@@ -71,6 +77,28 @@ class NotionClient:
         if last_error:
             raise last_error
     
+    def _retry_after_seconds(self, error: APIResponseError) -> Optional[float]:
+        """Return the Retry-After delay of a rate-limited response, if it sent a usable one.
+        
+        Negative values are clamped to 0 and large ones to max_delay; non-finite
+        values are ignored so the caller falls back to exponential backoff.
+        """
+        if error.code != APIErrorCode.RateLimited:
+            return None
+        
+        try:
+            delay = float(error.headers.get("Retry-After"))
+        except (AttributeError, TypeError, ValueError):
+            return None
+        
+        if not math.isfinite(delay):
+            return None
+        return min(max(delay, 0.0), self.max_delay)
+    
+    def _query_page_with_retry(self, **query_params: Any) -> Dict[str, Any]:
+        """Fetch a single database query page with retry logic."""
+        return self._retry_with_backoff(self.client.databases.query, **query_params)
+    
     def get_workspace_id(self) -> str:
         """Get the workspace ID for the authenticated user."""
         if self._workspace_id is None:
@@ -131,23 +159,38 @@ class NotionClient:
         Returns:
             List of database records
         """
-        try:
-            query_params: Dict[str, Any] = {"database_id": database_id}
-            
-            if filter_criteria:
-                query_params["filter"] = filter_criteria
-            if sorts:
-                query_params["sorts"] = sorts
+        # Collect the streamed records; iterate_database retries each page fetch
+        all_results = list(self.iterate_database(database_id, filter_criteria, sorts))
+        
+        logger.info(f"Retrieved {len(all_results)} records from database {database_id}")
+        return all_results
+    
+    def iterate_database(self, database_id: str, filter_criteria: Optional[Dict[str, Any]] = None,
+                         sorts: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream database records page by page without buffering the full result set.
+        
+        Args:
+            database_id: Target database ID
+            filter_criteria: Notion API filter object
+            sorts: List of sort objects
             
-            # Use pagination helper to get all results
-            all_results = collect_paginated_api(
-                self.client.databases.query,
+        Yields:
+            Database records in query order
+        """
+        query_params: Dict[str, Any] = {"database_id": database_id}
+        
+        if filter_criteria:
+            query_params["filter"] = filter_criteria
+        if sorts:
+            query_params["sorts"] = sorts
+        
+        try:
+            # Stream results page by page, retrying each page fetch
+            yield from iterate_paginated_api(
+                self._query_page_with_retry,
                 **query_params
             )
             
-            logger.info(f"Retrieved {len(all_results)} records from database {database_id}")
-            return all_results
-            
         except APIResponseError as e:
             if e.code == APIErrorCode.ObjectNotFound:
                 raise NotionClientError(f"Database {database_id} not found")
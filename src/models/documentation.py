@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 
 
@@ -47,11 +47,16 @@ class DocumentationModel(BaseModel):
     word_count: Optional[int] = Field(None, description="Approximate word count")
     estimated_read_time: Optional[int] = Field(None, description="Estimated read time in minutes")
     
+    # Content the current word_count was computed from
+    _counted_content: Optional[str] = PrivateAttr(default=None)
+    
     def calculate_metrics(self) -> None:
         """Calculate word count and estimated read time."""
         if self.content:
-            words = len(self.content.split())
-            self.word_count = words
+            if self.content != self._counted_content or self.word_count is None:
+                self.word_count = len(self.content.split())
+                self._counted_content = self.content
+            words = self.word_count
             # Average reading speed: 200-250 words per minute
             self.estimated_read_time = max(1, round(words / 225))
     
@@ -193,7 +198,8 @@ class DocumentationSuite(BaseModel):
         total_words = 0
         total_read_time = 0
         
-        for doc in self.get_all_documents():
+        documents = self.get_all_documents()
+        for doc in documents:
             doc.calculate_metrics()
             if doc.word_count:
                 total_words += doc.word_count
@@ -203,5 +209,5 @@ class DocumentationSuite(BaseModel):
         return {
             "total_word_count": total_words,
             "total_read_time": total_read_time,
-            "document_count": len(self.get_all_documents())
+            "document_count": len(documents)
         }
\ No newline at end of file
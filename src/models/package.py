@@ -1,11 +1,17 @@
 """Package data models for automation packages."""
 
+import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
 
+# Compiled once at import; the field validators run on every model construction
+_SLUG_RE = re.compile(r"[a-z0-9_-]+")
+_VERSION_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
+
+
 class PackageStatus(str, Enum):
     """Status enum for automation packages."""
     DRAFT = "draft"
@@ -54,16 +60,11 @@ class AutomationPackage(BaseModel):
     @classmethod
     def validate_slug(cls, v: str) -> str:
         """Ensure slug is URL-safe."""
-        # Check for invalid characters
-        valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_')
-        if not all(c in valid_chars for c in v):
-            raise ValueError("Slug must contain only alphanumeric characters, hyphens, and underscores")
-        
-        # Check for spaces and uppercase (which should be invalid)
-        if ' ' in v or any(c.isupper() for c in v):
+        # Lowercase alphanumerics, hyphens and underscores only
+        if not _SLUG_RE.fullmatch(v):
             raise ValueError("Slug must contain only alphanumeric characters, hyphens, and underscores")
             
-        return v.lower()
+        return v
     
     @field_validator("version")
     @classmethod
@@ -72,9 +73,8 @@ class AutomationPackage(BaseModel):
         parts = v.split(".")
         if len(parts) != 3:
             raise ValueError("Version must follow semantic versioning (x.y.z)")
-        for part in parts:
-            if not part.isdigit():
-                raise ValueError("Version parts must be numeric")
+        if not _VERSION_RE.fullmatch(v):
+            raise ValueError("Version parts must be numeric")
         return v
     
     def update_validation_timestamp(self):
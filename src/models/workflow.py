@@ -1,7 +1,7 @@
 """n8n workflow data models and validation."""
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime, timezone
 
 
@@ -9,6 +9,14 @@ class NodePosition(BaseModel):
     """Position coordinates for n8n nodes."""
     x: float = Field(..., description="X coordinate")
     y: float = Field(..., description="Y coordinate")
+    
+    @model_validator(mode="before")
+    @classmethod
+    def from_coordinate_pair(cls, data: Any) -> Any:
+        """Accept n8n's ``[x, y]`` export format so raw JSON validates in one pass."""
+        if isinstance(data, (list, tuple)) and len(data) == 2:
+            return {"x": data[0], "y": data[1]}
+        return data
 
 
 class N8nNode(BaseModel):
@@ -1,15 +1,39 @@
 """Business logic modules for the automation engine."""
 
-from .niche_research import NicheResearcher
-from .opportunity_mapping import OpportunityMapper
-from .assembly import WorkflowAssembler
-from .validation import WorkflowValidator
-from .documentation import DocumentationGenerator
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .niche_research import NicheResearcher
+    from .opportunity_mapping import OpportunityMapper
+    from .assembly import WorkflowAssembler
+    from .validation import WorkflowValidator
+    from .documentation import DocumentationGenerator
 
 __all__ = [
     "NicheResearcher",
-    "OpportunityMapper", 
+    "OpportunityMapper",
     "WorkflowAssembler",
     "WorkflowValidator",
     "DocumentationGenerator"
-]
\ No newline at end of file
+]
+
+# Submodules are imported on first attribute access, so importing one
+# module (e.g. src.modules.validation) doesn't load all the others
+_LAZY_EXPORTS = {
+    "NicheResearcher": ".niche_research",
+    "OpportunityMapper": ".opportunity_mapping",
+    "WorkflowAssembler": ".assembly",
+    "WorkflowValidator": ".validation",
+    "DocumentationGenerator": ".documentation"
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,7 @@
 import logging
 import requests
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from dataclasses import dataclass
@@ -11,6 +12,22 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _confidence_from_sources(source_count: int, has_industry_data: bool, has_pain_analysis: bool) -> float:
+    """Research confidence from the shape of the collected sources, memoized per shape."""
+    # Base confidence on number and quality of data sources
+    base_confidence = min(source_count / 5.0, 0.8)  # Max 0.8 base confidence
+    
+    # Adjust based on data quality indicators
+    quality_bonus = 0.0
+    if has_industry_data:
+        quality_bonus += 0.1
+    if has_pain_analysis:
+        quality_bonus += 0.1
+    
+    return min(base_confidence + quality_bonus, 1.0)
+
+
 @dataclass
 class PainPoint:
     """Represents a business pain point in a niche."""
@@ -429,18 +446,12 @@ class NicheResearcher:
         return industry_data.get("key_players", ["Existing Solution A", "Existing Solution B"])
     
     def _calculate_research_confidence(self, research_data: Dict[str, Any]) -> float:
-        # Base confidence on number and quality of data sources
-        source_count = len(research_data)
-        base_confidence = min(source_count / 5.0, 0.8)  # Max 0.8 base confidence
-        
-        # Adjust based on data quality indicators
-        quality_bonus = 0.0
-        if "simulated_industry_data" in research_data:
-            quality_bonus += 0.1
-        if "simulated_pain_analysis" in research_data:
-            quality_bonus += 0.1
-        
-        return min(base_confidence + quality_bonus, 1.0)
+        # Confidence depends only on which sources are present, not their contents
+        return _confidence_from_sources(
+            len(research_data),
+            "simulated_industry_data" in research_data,
+            "simulated_pain_analysis" in research_data
+        )
     
     def _estimate_market_size(self, research_data: Dict[str, Any]) -> str:
         industry_data = research_data.get("simulated_industry_data", {})
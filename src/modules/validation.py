@@ -2,7 +2,8 @@
 
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -11,6 +12,9 @@ from ..models.package import AutomationPackage
 
 logger = logging.getLogger(__name__)
 
+# Timestamp source for results and reports; tests swap in a frozen clock
+_clock = datetime.utcnow
+
 class ValidationResult:
     """Validation result with pass/fail status and details."""
     def __init__(self, passed: bool, level: str, message: str, details: Optional[Dict[str, Any]] = None):
@@ -18,7 +22,7 @@ class ValidationResult:
         self.level = level
         self.message = message
         self.details = details or {}
-        self.timestamp = datetime.utcnow()
+        self.timestamp = _clock()
 
 class WorkflowValidatorError(Exception):
     """Custom exception for validation operations."""
@@ -32,6 +36,12 @@ class WorkflowValidator:
     generates validation reports and checklists.
     """
     
+    # Secret keywords, reported in this order; one compiled alternation scans for all of them
+    _SECRET_KEYWORDS = ("password", "token")
+    _SECRET_RE = re.compile("|".join(_SECRET_KEYWORDS))
+    # n8n expression referencing an environment variable: {{ $env.NAME }}
+    _ENV_RE = re.compile(r'\$\{\{\s*\$env\.([A-Z_]+)\s*\}\}')
+    
     def __init__(self, fixtures_path: Optional[Path] = None):
         """Initialize workflow validator."""
         self.fixtures_path = fixtures_path or Path("tests/fixtures")
@@ -138,15 +148,18 @@ class WorkflowValidator:
         """Validate security practices."""
         results = []
         
+        # Serialize node parameters once for both scans
+        param_strings = self._collect_param_strings(workflow)
+        
         # Check for hardcoded secrets
-        hardcoded_secrets = self._find_hardcoded_secrets(workflow)
+        hardcoded_secrets = self._find_hardcoded_secrets(workflow, param_strings)
         if hardcoded_secrets:
             results.append(ValidationResult(False, "security", f"Hardcoded secrets found: {hardcoded_secrets}"))
         else:
             results.append(ValidationResult(True, "security", "No hardcoded secrets detected"))
         
         # Check environment variable usage
-        env_vars_used = self._extract_env_variables(workflow)
+        env_vars_used = self._extract_env_variables(workflow, param_strings)
         required_vars = set(self.validation_rules["required_env_vars"])
         missing_vars = required_vars - env_vars_used
         
@@ -253,40 +266,45 @@ class WorkflowValidator:
                 "overall_status": "PASS" if failed_checks == 0 else "FAIL"
             },
             "by_level": by_level,
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": _clock().isoformat()
         }
     
     # Helper methods
-    def _find_hardcoded_secrets(self, workflow: N8nWorkflow) -> List[str]:
+    def _collect_param_strings(self, workflow: N8nWorkflow) -> Tuple[List[str], List[str]]:
+        """Serialize every node's parameters in one pass.
+        
+        Returns:
+            Parallel lists of node names and their JSON-encoded parameters
+        """
+        names = [node.name for node in workflow.nodes]
+        params = [json.dumps(node.parameters) for node in workflow.nodes]
+        return names, params
+    
+    def _find_hardcoded_secrets(self, workflow: N8nWorkflow,
+                                param_strings: Optional[Tuple[List[str], List[str]]] = None) -> List[str]:
         """Find potential hardcoded secrets."""
         secrets = []
+        names, params = param_strings or self._collect_param_strings(workflow)
         
-        for node in workflow.nodes:
-            # Check for common secret patterns in parameters
-            params_str = json.dumps(node.parameters)
-            
-            if "password" in params_str and "{{" not in params_str:
-                secrets.append(f"Potential hardcoded password in {node.name}")
+        for name, params_str in zip(names, params):
+            # Templated parameters pull secrets from credentials, so skip the scan
+            if "{{" in params_str:
+                continue
             
-            if "token" in params_str and "{{" not in params_str:
-                secrets.append(f"Potential hardcoded token in {node.name}")
+            found = set(self._SECRET_RE.findall(params_str))
+            for keyword in self._SECRET_KEYWORDS:
+                if keyword in found:
+                    secrets.append(f"Potential hardcoded {keyword} in {name}")
         
         return secrets
     
-    def _extract_env_variables(self, workflow: N8nWorkflow) -> set:
+    def _extract_env_variables(self, workflow: N8nWorkflow,
+                               param_strings: Optional[Tuple[List[str], List[str]]] = None) -> set:
         """Extract environment variables referenced in workflow."""
-        env_vars = set()
-        
-        for node in workflow.nodes:
-            params_str = json.dumps(node.parameters)
-            
-            # Look for environment variable patterns
-            import re
-            env_pattern = r'\$\{\{\s*\$env\.([A-Z_]+)\s*\}\}'
-            matches = re.findall(env_pattern, params_str)
-            env_vars.update(matches)
+        _, params = param_strings or self._collect_param_strings(workflow)
         
-        return env_vars
+        # One scan over all parameters; NUL never occurs in JSON text, so no match spans two nodes
+        return set(self._ENV_RE.findall("\0".join(params)))
     
     def _estimate_execution_time(self, workflow: N8nWorkflow) -> float:
         """Estimate workflow execution time."""
@@ -1,16 +1,20 @@
 """Test configuration with pytest fixtures for automation package testing."""
 
 import pytest
+import copy
+import functools
 import json
-import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, create_autospec, patch
 
 from src.models.package import AutomationPackage, PackageStatus
 from src.models.workflow import N8nWorkflow, N8nNode, NodePosition
-from src.models.documentation import DocumentationSuite, ImplementationGuide, ConfigurationGuide
+from src.models.documentation import (
+    DocumentationSuite, ImplementationGuide, ConfigurationGuide,
+    DocumentationType, DocumentationAudience
+)
 from src.models.notion import LibraryDatabase, NotionBusinessOS
 from src.integrations.notion_client import NotionClient
 from src.integrations.n8n_processor import WorkflowProcessor
@@ -22,10 +26,10 @@ from src.modules.validation import WorkflowValidator
 # Sample Package Fixtures
 # ================================
 
-@pytest.fixture
-def sample_automation_package():
-    """Sample automation package for testing."""
-    return AutomationPackage(
+@pytest.fixture(scope="session")
+def _package_template():
+    """Session-wide sample package (trusted data, built without validation)."""
+    return AutomationPackage.model_construct(
         name="Lead Qualification Automation",
         slug="lead-qualification-automation",
         niche_tags=["sales", "crm", "lead-generation"],
@@ -54,6 +58,12 @@ def sample_automation_package():
     )
 
 
+@pytest.fixture
+def sample_automation_package(_package_template):
+    """Sample automation package for testing; a private copy of the session template."""
+    return _package_template.model_copy(deep=True)
+
+
 @pytest.fixture
 def invalid_automation_package():
     """Invalid automation package for testing validation."""
@@ -71,14 +81,14 @@ def invalid_automation_package():
 # Workflow Fixtures
 # ================================
 
-@pytest.fixture
-def sample_n8n_node():
-    """Sample n8n node for testing."""
-    return N8nNode(
+@pytest.fixture(scope="session")
+def _node_template():
+    """Session-wide sample n8n node (trusted data, built without validation)."""
+    return N8nNode.model_construct(
         id="webhook_node_1",
         name="webhook_trigger",
         type="n8n-nodes-base.webhook",
-        position=NodePosition(x=100, y=200),
+        position=NodePosition.model_construct(x=100, y=200),
         parameters={
             "path": "/webhook/lead-intake",
             "httpMethod": "POST",
@@ -90,34 +100,40 @@ def sample_n8n_node():
 
 
 @pytest.fixture
-def sample_n8n_workflow():
-    """Sample n8n workflow for testing."""
+def sample_n8n_node(_node_template):
+    """Sample n8n node for testing; a private copy of the session template."""
+    return _node_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _workflow_template():
+    """Session-wide sample n8n workflow (trusted data, built without validation)."""
     nodes = [
-        N8nNode(
+        N8nNode.model_construct(
             id="webhook_1",
             name="lead_intake_webhook",
             type="n8n-nodes-base.webhook",
-            position=NodePosition(x=100, y=100),
+            position=NodePosition.model_construct(x=100, y=100),
             parameters={
                 "path": "/lead-intake",
                 "httpMethod": "POST"
             }
         ),
-        N8nNode(
+        N8nNode.model_construct(
             id="hubspot_1",
             name="hubspot_create_contact",
             type="n8n-nodes-base.hubspot",
-            position=NodePosition(x=300, y=100),
+            position=NodePosition.model_construct(x=300, y=100),
             parameters={
                 "operation": "create",
                 "resource": "contact"
             }
         ),
-        N8nNode(
+        N8nNode.model_construct(
             id="slack_1",
             name="slack_notify_team",
             type="n8n-nodes-base.slack",
-            position=NodePosition(x=500, y=100),
+            position=NodePosition.model_construct(x=500, y=100),
             parameters={
                 "channel": "#sales",
                 "text": "New lead qualified"
@@ -134,7 +150,7 @@ def sample_n8n_workflow():
         }
     }
     
-    return N8nWorkflow(
+    return N8nWorkflow.model_construct(
         name="lead_qualification_workflow",
         nodes=nodes,
         connections=connections,
@@ -143,6 +159,18 @@ def sample_n8n_workflow():
     )
 
 
+@pytest.fixture
+def sample_n8n_workflow(_workflow_template):
+    """Sample n8n workflow for testing; a private copy of the session template."""
+    return _workflow_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def readonly_n8n_workflow(_workflow_template):
+    """Session-wide copy of the workflow template for tests that never mutate it."""
+    return _workflow_template.model_copy(deep=True)
+
+
 @pytest.fixture
 def invalid_n8n_workflow():
     """Invalid n8n workflow for testing validation."""
@@ -153,55 +181,87 @@ def invalid_n8n_workflow():
     )
 
 
+SAMPLE_WORKFLOW_JSON: Dict[str, Any] = {
+    "name": "sample_workflow",
+    "nodes": [
+        {
+            "id": "webhook_1",
+            "name": "webhook_trigger",
+            "type": "n8n-nodes-base.webhook",
+            "position": [100, 100],
+            "parameters": {
+                "path": "/webhook",
+                "httpMethod": "POST"
+            }
+        },
+        {
+            "id": "set_1", 
+            "name": "data_processor",
+            "type": "n8n-nodes-base.set",
+            "position": [300, 100],
+            "parameters": {
+                "values": {
+                    "processed": "true",
+                    "timestamp": "{{ new Date().toISOString() }}"
+                }
+            }
+        }
+    ],
+    "connections": {
+        "webhook_1": {
+            "main": [{"node": "set_1", "type": "main", "index": 0}]
+        }
+    },
+    "active": False,
+    "tags": ["test", "sample"]
+}
+
+
 @pytest.fixture
 def sample_workflow_json():
     """Sample n8n workflow JSON data."""
-    return {
-        "name": "sample_workflow",
-        "nodes": [
-            {
-                "id": "webhook_1",
-                "name": "webhook_trigger",
-                "type": "n8n-nodes-base.webhook",
-                "position": [100, 100],
-                "parameters": {
-                    "path": "/webhook",
-                    "httpMethod": "POST"
-                }
-            },
-            {
-                "id": "set_1", 
-                "name": "data_processor",
-                "type": "n8n-nodes-base.set",
-                "position": [300, 100],
-                "parameters": {
-                    "values": {
-                        "processed": "true",
-                        "timestamp": "{{ new Date().toISOString() }}"
-                    }
-                }
-            }
-        ],
-        "connections": {
-            "webhook_1": {
-                "main": [{"node": "set_1", "type": "main", "index": 0}]
-            }
-        },
-        "active": False,
-        "tags": ["test", "sample"]
-    }
+    return copy.deepcopy(SAMPLE_WORKFLOW_JSON)
+
+
+@pytest.fixture(scope="session")
+def sample_workflow_json_raw():
+    """Raw n8n export bytes for single-pass ``model_validate_json`` parsing."""
+    return (Path(__file__).parent / "fixtures" / "workflows" / "simple_webhook_workflow.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def cached_process_workflow(tmp_path_factory):
+    """Memoized ``WorkflowProcessor.process_workflow`` over a session-scoped vault.
+    
+    The full pipeline runs once per ``(workflow_name, key_field)``; callers
+    get a deep copy because ``N8nWorkflow`` is mutable.
+    """
+    vault_path = tmp_path_factory.mktemp("vault")
+    with open(vault_path / "test_workflow.json", 'w') as f:
+        json.dump(SAMPLE_WORKFLOW_JSON, f, indent=2)
+    processor = WorkflowProcessor(automation_vault_path=vault_path)
+    
+    @functools.lru_cache(maxsize=None)
+    def _cached_process(workflow_name: str, key_field: str) -> N8nWorkflow:
+        return processor.process_workflow(workflow_name, key_field)
+    
+    def _process(workflow_name: str, key_field: str = "email") -> N8nWorkflow:
+        return _cached_process(workflow_name, key_field).model_copy(deep=True)
+    
+    return _process
 
 
 # ================================
 # Documentation Fixtures
 # ================================
 
-@pytest.fixture
-def sample_documentation_suite():
-    """Sample documentation suite for testing."""
-    impl_guide = ImplementationGuide(
+@pytest.fixture(scope="session")
+def _documentation_suite_template():
+    """Session-wide sample documentation suite (trusted data, built without validation)."""
+    impl_guide = ImplementationGuide.model_construct(
+        doc_type=DocumentationType.IMPLEMENTATION,
         title="Lead Qualification Implementation",
-        audience="technical",
+        audience=DocumentationAudience.TECHNICAL,
         package_name="Lead Qualification Automation",
         package_slug="lead-qualification-automation",
         content="# Implementation Guide\n\nStep-by-step implementation...",
@@ -214,9 +274,10 @@ def sample_documentation_suite():
         ]
     )
     
-    config_guide = ConfigurationGuide(
+    config_guide = ConfigurationGuide.model_construct(
+        doc_type=DocumentationType.CONFIGURATION,
         title="Lead Qualification Configuration",
-        audience="technical", 
+        audience=DocumentationAudience.TECHNICAL,
         package_name="Lead Qualification Automation",
         package_slug="lead-qualification-automation",
         content="# Configuration Guide\n\nEnvironment variables...",
@@ -229,7 +290,7 @@ def sample_documentation_suite():
         rate_limits={"HubSpot": "100 requests/10 seconds", "Slack": "1 message/second"}
     )
     
-    return DocumentationSuite(
+    return DocumentationSuite.model_construct(
         package_name="Lead Qualification Automation",
         package_slug="lead-qualification-automation",
         implementation_guide=impl_guide,
@@ -237,6 +298,12 @@ def sample_documentation_suite():
     )
 
 
+@pytest.fixture
+def sample_documentation_suite(_documentation_suite_template):
+    """Sample documentation suite for testing; a private copy of the session template."""
+    return _documentation_suite_template.model_copy(deep=True)
+
+
 # ================================
 # Notion Fixtures
 # ================================
@@ -247,12 +314,31 @@ def sample_notion_database():
     return LibraryDatabase()
 
 
-@pytest.fixture
-def sample_notion_business_os():
-    """Sample Notion Business OS for testing."""
+@pytest.fixture(scope="session")
+def _business_os_template():
+    """Session-wide default Business OS schema; read-only, copy before mutating."""
     return NotionBusinessOS.create_default_schema()
 
 
+@pytest.fixture
+def sample_notion_business_os(_business_os_template):
+    """Sample Notion Business OS for testing; a private copy of the session template."""
+    return _business_os_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def readonly_notion_business_os(_business_os_template):
+    """Session-wide copy of the Business OS template for tests that never mutate it."""
+    return _business_os_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def notion_responses():
+    """Canonical Notion API payloads keyed by scenario (treat as read-only)."""
+    responses_path = Path(__file__).parent / "fixtures" / "notion" / "integration_responses.json"
+    return json.loads(responses_path.read_text())
+
+
 @pytest.fixture
 def mock_notion_client():
     """Mock Notion client for testing."""
@@ -302,13 +388,16 @@ def mock_workflow_processor():
     return mock
 
 
-@pytest.fixture
-def mock_niche_researcher():
-    """Mock niche research for testing."""
-    mock = Mock(spec=NicheResearcher)
-    
-    # Mock research results
-    mock.research_niche.return_value = NicheBrief(
+@pytest.fixture(scope="session")
+def _niche_researcher_autospec():
+    """Autospec'd NicheResearcher, built once per session and reset before each use."""
+    return create_autospec(NicheResearcher, instance=True)
+
+
+@pytest.fixture(scope="session")
+def _niche_brief_template():
+    """NicheBrief returned by the mocked researcher, validated once per session."""
+    return NicheBrief(
         niche_name="test_niche",
         profile={"industry": "Technology", "size": "SMB"},
         pain_points=[
@@ -331,10 +420,31 @@ def mock_niche_researcher():
         research_confidence=0.85,
         technology_adoption="medium"
     )
+
+
+@pytest.fixture
+def mock_niche_researcher(_niche_researcher_autospec, _niche_brief_template):
+    """Mock niche research for testing."""
+    mock = _niche_researcher_autospec
+    mock.reset_mock(return_value=True, side_effect=True)
+    
+    # Mock research results
+    mock.research_niche.return_value = _niche_brief_template.model_copy(deep=True)
     
     return mock
 
 
+@pytest.fixture
+def mock_session_get():
+    """Patched requests.Session.get answering 200 {"test": "data"}, with research pacing disabled."""
+    response = Mock(status_code=200)
+    response.json.return_value = {"test": "data"}
+    
+    with patch("requests.Session.get", return_value=response) as mock_get, \
+         patch("src.modules.niche_research.time.sleep"):
+        yield mock_get
+
+
 @pytest.fixture
 def mock_validator():
     """Mock workflow validator for testing."""
@@ -361,10 +471,15 @@ def mock_validator():
 # ================================
 
 @pytest.fixture
-def temp_directory():
-    """Temporary directory for testing file operations."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_directory(tmp_path_factory):
+    """Temporary directory for testing file operations (unique per test and xdist worker)."""
+    return tmp_path_factory.mktemp("temp")
+
+
+@pytest.fixture
+def fake_vault(fs):
+    """In-memory vault directory on pyfakefs, for tests that only touch a few small files."""
+    return Path(fs.create_dir("/vault").path)
 
 
 @pytest.fixture
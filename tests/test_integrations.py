@@ -1,13 +1,22 @@
 """Tests for API integration clients (Notion and n8n)."""
 
 import pytest
+import gc
 import json
+import math
+import statistics
 import time
-from unittest.mock import Mock, patch, MagicMock
+import tracemalloc
+from dataclasses import dataclass
+from unittest.mock import Mock, patch, MagicMock, create_autospec
 from pathlib import Path
 
-from notion_client import APIResponseError, APIErrorCode
+from notion_client import APIResponseError, APIErrorCode, Client as NotionSdkClient
+from notion_client.api_endpoints import (
+    BlocksEndpoint, DatabasesEndpoint, PagesEndpoint, SearchEndpoint, UsersEndpoint
+)
 
+import src.integrations.notion_client as nc_mod
 from src.integrations.notion_client import NotionClient, NotionClientError
 from src.integrations.n8n_processor import WorkflowProcessor, WorkflowProcessorError
 from src.models.package import AutomationPackage, PackageStatus
@@ -15,9 +24,124 @@ from src.models.workflow import N8nWorkflow, N8nNode, NodePosition
 from src.models.notion import LibraryDatabase, NotionBusinessOS
 
 
+# The SDK assigns its endpoints in __init__, so a class autospec lacks them
+_SDK_ENDPOINTS = {
+    "blocks": BlocksEndpoint,
+    "databases": DatabasesEndpoint,
+    "pages": PagesEndpoint,
+    "users": UsersEndpoint
+}
+
+# (status_code, code, message) for the API errors the mocks raise
+_API_ERROR_SPECS = {
+    "not_found": (404, APIErrorCode.ObjectNotFound, "Parent page not found"),
+    "rate_limited": (429, APIErrorCode.RateLimited, "Rate limited"),
+    "unauthorized": (401, APIErrorCode.Unauthorized, "Unauthorized"),
+    "server_error": (500, APIErrorCode.InternalServerError, "Internal server error"),
+    "conflict": (409, APIErrorCode.ConflictError, "Conflict - page was modified by another user")
+}
+
+# 20 ms per node: the previous 1 s budget for a 50-node workflow
+PER_NODE_THRESHOLD_NS = 20_000_000
+
+# Workflow sizes for the scaling check; log-log slope above this means super-linear
+PROCESSING_SIZES = (10, 50, 200)
+MAX_SCALING_SLOPE = 1.3
+PROCESSING_REPEATS = 3
+
+
+@dataclass(slots=True)
+class _PageRow:
+    """Slotted page row; the large dataset test only counts results."""
+    id: str
+    title: str
+
+
+# Pre-built once as columns so repeated or parametrized runs reuse the same rows
+_LARGE_IDS = [f"page_{i}" for i in range(1000)]
+_LARGE_TITLES = [f"Page {i}" for i in range(1000)]
+_LARGE_DATASET = [_PageRow(page_id, title) for page_id, title in zip(_LARGE_IDS, _LARGE_TITLES)]
+
+# 10KB parameter payload shared by reference, so the memory test measures the processor
+_LARGE_DATA = "x" * 10000
+
+
+def _api_error(kind, headers=None):
+    """Fresh API error, so a raise never extends a traceback shared with other tests."""
+    status_code, code, message = _API_ERROR_SPECS[kind]
+    return APIResponseError(
+        response=Mock(status_code=status_code, headers=headers or {}),
+        message=message,
+        code=code
+    )
+
+
+def _raise_api_error(kind, headers=None):
+    """Mock side effect raising a fresh API error on every call."""
+    def side_effect(*args, **kwargs):
+        raise _api_error(kind, headers)
+    return side_effect
+
+
+def _fast_node(i):
+    """Trusted set node built without per-field validation."""
+    return N8nNode.model_construct(
+        id=f"node_{i}",
+        name=f"node_{i}",
+        type="n8n-nodes-base.set",
+        position=NodePosition.model_construct(x=i*100, y=100)
+    )
+
+
+def _time_processing_stages(processor, n_nodes):
+    """Best-of-PROCESSING_REPEATS ns per pipeline stage, plus the last processed workflow."""
+    stage_ns = {}
+    for _ in range(PROCESSING_REPEATS):
+        processed = N8nWorkflow(
+            name="large_workflow",
+            nodes=[_fast_node(i) for i in range(n_nodes)],
+            connections={}
+        )
+        for stage in ("inject_retry_logic", "add_logging_instrumentation", "add_error_handling"):
+            t0 = time.perf_counter_ns()
+            processed = getattr(processor, stage)(processed)
+            elapsed = time.perf_counter_ns() - t0
+            stage_ns[stage] = min(stage_ns.get(stage, elapsed), elapsed)
+    return stage_ns, processed
+
+
+@pytest.fixture(scope="session")
+def shared_processor(tmp_path_factory):
+    """Session-wide processor; WorkflowProcessor keeps no per-workflow state."""
+    return WorkflowProcessor(automation_vault_path=tmp_path_factory.mktemp("vault"))
+
+
+@pytest.fixture(scope="session")
+def _sdk_client_autospec():
+    """Autospec'd Notion SDK client, built once per session and reset before each use."""
+    sdk_client = create_autospec(NotionSdkClient, instance=True)
+    for name, endpoint in _SDK_ENDPOINTS.items():
+        setattr(sdk_client, name, create_autospec(endpoint, instance=True))
+    # search is a callable endpoint; spec it from a detached instance so the
+    # signature check binds __call__ without self
+    sdk_client.search = create_autospec(SearchEndpoint(parent=None))
+    return sdk_client
+
+
+@pytest.fixture
+def patched_notion_client(_sdk_client_autospec):
+    """Patch the Notion SDK Client, resolved once on the imported module."""
+    _sdk_client_autospec.reset_mock(return_value=True, side_effect=True)
+    with patch.object(nc_mod, 'Client') as mock_client_class:
+        mock_client_class.return_value = _sdk_client_autospec
+        yield mock_client_class
+
+
 class TestNotionClient:
     """Test NotionClient integration functionality."""
     
+    pytestmark = pytest.mark.xdist_group(name="notion")
+    
     def test_notion_client_initialization_success(self, mock_environment_variables):
         """Test successful NotionClient initialization."""
         client = NotionClient()
@@ -44,16 +168,11 @@ class TestNotionClient:
         assert client.max_retries == 5
         assert client.retry_delay == 2.0
     
-    @patch('src.integrations.notion_client.Client')
-    def test_create_database_success(self, mock_client_class, mock_environment_variables):
+    def test_create_database_success(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test successful database creation."""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        mock_client_instance.databases.create.return_value = {
-            "id": "db_test_123",
-            "title": [{"text": {"content": "Test Database"}}]
-        }
+        mock_client_instance = patched_notion_client.return_value
+        mock_client_instance.databases.create.return_value = notion_responses["create_database_ok"]
         
         client = NotionClient()
         database_schema = LibraryDatabase()
@@ -63,17 +182,11 @@ class TestNotionClient:
         assert db_id == "db_test_123"
         mock_client_instance.databases.create.assert_called_once()
     
-    @patch('src.integrations.notion_client.Client')
-    def test_create_database_not_found_error(self, mock_client_class, mock_environment_variables):
+    def test_create_database_not_found_error(self, patched_notion_client, mock_environment_variables):
         """Test database creation with parent page not found."""
         # Setup mock to raise not found error
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        mock_client_instance.databases.create.side_effect = APIResponseError(
-            response=Mock(status_code=404),
-            message="Parent page not found",
-            code=APIErrorCode.ObjectNotFound
-        )
+        mock_client_instance = patched_notion_client.return_value
+        mock_client_instance.databases.create.side_effect = _api_error("not_found")
         
         client = NotionClient()
         database_schema = LibraryDatabase()
@@ -83,19 +196,14 @@ class TestNotionClient:
         
         assert "Parent page invalid_parent not found" in str(exc_info.value)
     
-    @patch('src.integrations.notion_client.Client')
-    def test_query_database_success(self, mock_client_class, mock_environment_variables):
+    def test_query_database_success(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test successful database query."""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Mock paginated response
-        with patch('src.integrations.notion_client.collect_paginated_api') as mock_paginated:
-            mock_paginated.return_value = [
-                {"id": "page_1", "properties": {"Name": {"title": "Test 1"}}},
-                {"id": "page_2", "properties": {"Name": {"title": "Test 2"}}}
-            ]
+        with patch.object(nc_mod, 'iterate_paginated_api') as mock_paginated:
+            mock_paginated.return_value = iter(notion_responses["query_database_pages"])
             
             client = NotionClient()
             results = client.query_database("db_test_123")
@@ -104,14 +212,12 @@ class TestNotionClient:
             assert results[0]["id"] == "page_1"
             mock_paginated.assert_called_once()
     
-    @patch('src.integrations.notion_client.Client')
-    def test_query_database_with_filters(self, mock_client_class, mock_environment_variables):
+    def test_query_database_with_filters(self, patched_notion_client, mock_environment_variables):
         """Test database query with filters and sorting."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
-        with patch('src.integrations.notion_client.collect_paginated_api') as mock_paginated:
-            mock_paginated.return_value = []
+        with patch.object(nc_mod, 'iterate_paginated_api') as mock_paginated:
+            mock_paginated.return_value = iter([])
             
             client = NotionClient()
             filter_criteria = {"property": "Status", "select": {"equals": "Validated"}}
@@ -124,15 +230,10 @@ class TestNotionClient:
             assert call_args[1]["filter"] == filter_criteria
             assert call_args[1]["sorts"] == sorts
     
-    @patch('src.integrations.notion_client.Client')
-    def test_create_page_success(self, mock_client_class, mock_environment_variables):
+    def test_create_page_success(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test successful page creation."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        mock_client_instance.pages.create.return_value = {
-            "id": "page_test_123",
-            "properties": {"Name": {"title": "Test Page"}}
-        }
+        mock_client_instance = patched_notion_client.return_value
+        mock_client_instance.pages.create.return_value = notion_responses["pages_create_ok"]
         
         client = NotionClient()
         properties = {
@@ -145,15 +246,10 @@ class TestNotionClient:
         assert page_id == "page_test_123"
         mock_client_instance.pages.create.assert_called_once()
     
-    @patch('src.integrations.notion_client.Client')
-    def test_update_page_success(self, mock_client_class, mock_environment_variables):
+    def test_update_page_success(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test successful page update."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        mock_client_instance.pages.update.return_value = {
-            "id": "page_test_123",
-            "properties": {"Status": {"select": {"name": "Updated"}}}
-        }
+        mock_client_instance = patched_notion_client.return_value
+        mock_client_instance.pages.update.return_value = notion_responses["pages_update_ok"]
         
         client = NotionClient()
         properties = {"Status": {"select": {"name": "Updated"}}}
@@ -166,65 +262,47 @@ class TestNotionClient:
             properties=properties
         )
     
-    @patch('src.integrations.notion_client.Client')
-    def test_retry_logic_success_after_failure(self, mock_client_class, mock_environment_variables):
+    def test_retry_logic_success_after_failure(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test retry logic succeeds after initial failure."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # First call fails, second succeeds
         mock_client_instance.databases.create.side_effect = [
-            APIResponseError(
-                response=Mock(status_code=429), 
-                message="Rate limited",
-                code=APIErrorCode.RateLimited
-            ),
-            {"id": "db_success_123"}
+            _api_error("rate_limited", {"Retry-After": "0.05"}),
+            notion_responses["create_database_retry_ok"]
         ]
         
         client = NotionClient(retry_delay=0.01)  # Fast retry for testing
         database_schema = LibraryDatabase()
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
+        with patch.object(nc_mod.time, 'sleep'):  # Mock sleep to speed up test
             db_id = client.create_database("parent_123", database_schema)
         
         assert db_id == "db_success_123"
         assert mock_client_instance.databases.create.call_count == 2
     
-    @patch('src.integrations.notion_client.Client')
-    def test_retry_logic_exhaustion(self, mock_client_class, mock_environment_variables):
+    def test_retry_logic_exhaustion(self, patched_notion_client, mock_environment_variables):
         """Test retry logic exhaustion."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Always fail
-        mock_client_instance.databases.create.side_effect = APIResponseError(
-            response=Mock(status_code=500),
-            message="Internal server error",
-            code=APIErrorCode.InternalServerError
-        )
+        mock_client_instance.databases.create.side_effect = _raise_api_error("server_error")
         
         client = NotionClient(max_retries=2, retry_delay=0.01)
         database_schema = LibraryDatabase()
         
-        with patch('time.sleep'):  # Mock sleep
+        with patch.object(nc_mod.time, 'sleep'):  # Mock sleep
             with pytest.raises(APIResponseError):
                 client.create_database("parent_123", database_schema)
         
         # Should try 3 times (initial + 2 retries)
         assert mock_client_instance.databases.create.call_count == 3
     
-    @patch('src.integrations.notion_client.Client')
-    def test_no_retry_for_unauthorized(self, mock_client_class, mock_environment_variables):
+    def test_no_retry_for_unauthorized(self, patched_notion_client, mock_environment_variables):
         """Test no retry for unauthorized errors."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
-        mock_client_instance.databases.create.side_effect = APIResponseError(
-            response=Mock(status_code=401),
-            message="Unauthorized",
-            code=APIErrorCode.Unauthorized
-        )
+        mock_client_instance.databases.create.side_effect = _api_error("unauthorized")
         
         client = NotionClient()
         database_schema = LibraryDatabase()
@@ -235,11 +313,9 @@ class TestNotionClient:
         # Should only try once (no retries for auth errors)
         assert mock_client_instance.databases.create.call_count == 1
     
-    @patch('src.integrations.notion_client.Client')
-    def test_create_business_os_success(self, mock_client_class, mock_environment_variables):
+    def test_create_business_os_success(self, patched_notion_client, mock_environment_variables):
         """Test successful Business OS creation."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Mock database creation responses
         create_call_count = 0
@@ -260,21 +336,16 @@ class TestNotionClient:
         assert "clients" in database_ids
         assert "deployments" in database_ids
     
-    @patch('src.integrations.notion_client.Client')
-    def test_create_library_record_success(self, mock_client_class, mock_environment_variables, sample_automation_package):
+    def test_create_library_record_success(self, patched_notion_client, mock_environment_variables, sample_automation_package,
+                                           notion_responses):
         """Test successful library record creation."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Mock search response
-        mock_client_instance.search.return_value = {
-            "results": [{"id": "db_library_123", "title": "Library"}]
-        }
+        mock_client_instance.search.return_value = notion_responses["search_library"]
         
         # Mock page creation
-        mock_client_instance.pages.create.return_value = {
-            "id": "page_record_123"
-        }
+        mock_client_instance.pages.create.return_value = notion_responses["pages_create_record_ok"]
         
         client = NotionClient()
         page_id = client.create_library_record(sample_automation_package)
@@ -286,16 +357,12 @@ class TestNotionClient:
         )
         mock_client_instance.pages.create.assert_called_once()
     
-    @patch('src.integrations.notion_client.Client')
-    def test_verify_database_schema_success(self, mock_client_class, mock_environment_variables):
+    def test_verify_database_schema_success(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test successful schema verification."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Mock search to return all required databases
-        mock_client_instance.search.return_value = {
-            "results": [{"id": "db_123", "title": "Test Database"}]
-        }
+        mock_client_instance.search.return_value = notion_responses["search_any_database"]
         
         client = NotionClient()
         result = client.verify_database_schema()
@@ -304,18 +371,17 @@ class TestNotionClient:
         # Should search for each required database
         assert mock_client_instance.search.call_count == 5
     
-    @patch('src.integrations.notion_client.Client')
-    def test_verify_database_schema_missing_database(self, mock_client_class, mock_environment_variables):
+    def test_verify_database_schema_missing_database(self, patched_notion_client, mock_environment_variables,
+                                                     notion_responses):
         """Test schema verification with missing database."""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
         
         # Mock search to return empty results for some databases
         def mock_search(query, **kwargs):
             if query == "Library":
-                return {"results": [{"id": "db_123", "title": "Library"}]}
+                return notion_responses["search_library"]
             else:
-                return {"results": []}  # Missing database
+                return notion_responses["search_empty"]  # Missing database
         
         mock_client_instance.search.side_effect = mock_search
         
@@ -328,9 +394,85 @@ class TestNotionClient:
         assert "not found" in str(exc_info.value)
 
 
+def _strip_retry_config(workflow):
+    """Remove retry config so injection has something to do."""
+    for node in workflow.nodes:
+        node.retries = 0
+        node.retry_on_fail = False
+
+
+def _set_invalid_names(workflow):
+    """Give the workflow and its first node non-conforming names."""
+    workflow.name = "Invalid Workflow Name!"
+    workflow.nodes[0].name = "Invalid Node Name!"
+
+
+def _check_naming(updated_workflow, original_node_count):
+    # Names should be normalized
+    assert updated_workflow.name == "invalid_workflow_name"
+    assert updated_workflow.nodes[0].name == "invalid_node_name"
+
+
+def _check_retry(updated_workflow, original_node_count):
+    # All nodes should have retry logic
+    for node in updated_workflow.nodes:
+        assert node.retries == 3
+        assert node.retry_on_fail is True
+        assert node.parameters.get("retryOnFail") is True
+        assert node.parameters.get("maxTries") == 3
+
+
+def _check_idempotency(updated_workflow, original_node_count):
+    # Only the HubSpot node supports idempotency; webhook does not
+    by_type = {n.type: n for n in updated_workflow.nodes}
+    hubspot_node = by_type["n8n-nodes-base.hubspot"]
+    webhook_node = by_type["n8n-nodes-base.webhook"]
+    
+    assert "idempotencyKey" in hubspot_node.parameters
+    assert "deduplicationField" in hubspot_node.parameters
+    assert "idempotencyKey" not in webhook_node.parameters
+
+
+def _check_logging(updated_workflow, original_node_count):
+    # Should have added one logging node per original node
+    assert len(updated_workflow.nodes) > original_node_count
+    logging_nodes = [n for n in updated_workflow.nodes if n.name.startswith("log__")]
+    assert len(logging_nodes) == original_node_count
+    
+    # Check logging node structure
+    log_node = logging_nodes[0]
+    assert log_node.type == "n8n-nodes-base.set"
+    assert "timestamp" in log_node.parameters["values"]
+    assert "node_id" in log_node.parameters["values"]
+
+
+def _check_error_handling(updated_workflow, original_node_count):
+    # Should have added one error node per original node
+    assert len(updated_workflow.nodes) > original_node_count
+    error_nodes = [n for n in updated_workflow.nodes if n.name.startswith("error__")]
+    assert len(error_nodes) == original_node_count
+    
+    # Check error node structure
+    error_node = error_nodes[0]
+    assert error_node.type == "n8n-nodes-base.webhook"
+    assert error_node.parameters["path"] == "/error-handler"
+    assert error_node.parameters["httpMethod"] == "POST"
+
+
+PROCESSOR_MUTATIONS = [
+    ("enforce_naming_conventions", _set_invalid_names, _check_naming),
+    ("inject_retry_logic", _strip_retry_config, _check_retry),
+    ("add_idempotency_keys", None, _check_idempotency),
+    ("add_logging_instrumentation", None, _check_logging),
+    ("add_error_handling", None, _check_error_handling),
+]
+
+
 class TestWorkflowProcessor:
     """Test WorkflowProcessor functionality."""
     
+    pytestmark = pytest.mark.xdist_group(name="workflow")
+    
     def test_workflow_processor_initialization(self, temp_directory):
         """Test WorkflowProcessor initialization."""
         processor = WorkflowProcessor(automation_vault_path=temp_directory)
@@ -438,19 +580,22 @@ class TestWorkflowProcessor:
         
         assert "Invalid JSON" in str(exc_info.value)
     
-    def test_enforce_naming_conventions(self, temp_directory, sample_n8n_workflow):
-        """Test naming convention enforcement."""
+    @pytest.mark.parametrize(
+        "method,prepare,check",
+        PROCESSOR_MUTATIONS,
+        ids=[method for method, _, _ in PROCESSOR_MUTATIONS]
+    )
+    def test_processor_mutation(self, temp_directory, sample_n8n_workflow, method, prepare, check):
+        """Test each in-place processor mutation against the sample workflow."""
         processor = WorkflowProcessor(automation_vault_path=temp_directory)
         
-        # Set invalid names
-        sample_n8n_workflow.name = "Invalid Workflow Name!"
-        sample_n8n_workflow.nodes[0].name = "Invalid Node Name!"
+        if prepare is not None:
+            prepare(sample_n8n_workflow)
+        original_node_count = len(sample_n8n_workflow.nodes)
         
-        updated_workflow = processor.enforce_naming_conventions(sample_n8n_workflow)
+        updated_workflow = getattr(processor, method)(sample_n8n_workflow)
         
-        # Names should be normalized
-        assert updated_workflow.name == "invalid_workflow_name"
-        assert updated_workflow.nodes[0].name == "invalid_node_name"
+        check(updated_workflow, original_node_count)
     
     def test_normalize_name(self, temp_directory):
         """Test name normalization."""
@@ -491,60 +636,6 @@ class TestWorkflowProcessor:
             result = processor._add_integration_prefix(node)
             assert result == expected
     
-    def test_inject_retry_logic(self, temp_directory, sample_n8n_workflow):
-        """Test retry logic injection."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        # Remove retry config from sample workflow
-        for node in sample_n8n_workflow.nodes:
-            node.retries = 0
-            node.retry_on_fail = False
-        
-        updated_workflow = processor.inject_retry_logic(sample_n8n_workflow)
-        
-        # All nodes should have retry logic
-        for node in updated_workflow.nodes:
-            assert node.retries == 3
-            assert node.retry_on_fail is True
-            assert node.parameters.get("retryOnFail") is True
-            assert node.parameters.get("maxTries") == 3
-    
-    def test_add_idempotency_keys(self, temp_directory):
-        """Test idempotency key addition.""" 
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        # Create workflow with idempotency-supporting nodes
-        nodes = [
-            N8nNode(
-                id="hubspot_1",
-                name="hubspot_node",
-                type="n8n-nodes-base.hubspot",  # Supports idempotency
-                position=NodePosition(x=100, y=100)
-            ),
-            N8nNode(
-                id="webhook_1", 
-                name="webhook_node",
-                type="n8n-nodes-base.webhook",  # Doesn't support idempotency
-                position=NodePosition(x=200, y=100)
-            )
-        ]
-        
-        workflow = N8nWorkflow(
-            name="test_workflow",
-            nodes=nodes,
-            connections={}
-        )
-        
-        updated_workflow = processor.add_idempotency_keys(workflow, "email")
-        
-        # Only HubSpot node should have idempotency key
-        hubspot_node = next(n for n in updated_workflow.nodes if n.type == "n8n-nodes-base.hubspot")
-        webhook_node = next(n for n in updated_workflow.nodes if n.type == "n8n-nodes-base.webhook")
-        
-        assert "idempotencyKey" in hubspot_node.parameters
-        assert "deduplicationField" in hubspot_node.parameters
-        assert "idempotencyKey" not in webhook_node.parameters
-    
     def test_supports_idempotency(self, temp_directory):
         """Test idempotency support detection."""
         processor = WorkflowProcessor(automation_vault_path=temp_directory)
@@ -581,48 +672,6 @@ class TestWorkflowProcessor:
             )
             assert processor._supports_idempotency(node) is False
     
-    def test_add_logging_instrumentation(self, temp_directory, sample_n8n_workflow):
-        """Test logging instrumentation addition."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        original_node_count = len(sample_n8n_workflow.nodes)
-        updated_workflow = processor.add_logging_instrumentation(sample_n8n_workflow)
-        
-        # Should have added logging nodes
-        new_node_count = len(updated_workflow.nodes)
-        assert new_node_count > original_node_count
-        
-        # Check for logging nodes
-        logging_nodes = [n for n in updated_workflow.nodes if n.name.startswith("log__")]
-        assert len(logging_nodes) == original_node_count
-        
-        # Check logging node structure
-        log_node = logging_nodes[0]
-        assert log_node.type == "n8n-nodes-base.set"
-        assert "timestamp" in log_node.parameters["values"]
-        assert "node_id" in log_node.parameters["values"]
-    
-    def test_add_error_handling(self, temp_directory, sample_n8n_workflow):
-        """Test error handling addition."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        original_node_count = len(sample_n8n_workflow.nodes)
-        updated_workflow = processor.add_error_handling(sample_n8n_workflow)
-        
-        # Should have added error nodes
-        new_node_count = len(updated_workflow.nodes)
-        assert new_node_count > original_node_count
-        
-        # Check for error nodes
-        error_nodes = [n for n in updated_workflow.nodes if n.name.startswith("error__")]
-        assert len(error_nodes) == original_node_count
-        
-        # Check error node structure
-        error_node = error_nodes[0]
-        assert error_node.type == "n8n-nodes-base.webhook"
-        assert error_node.parameters["path"] == "/error-handler"
-        assert error_node.parameters["httpMethod"] == "POST"
-    
     def test_combine_workflows(self, temp_directory):
         """Test workflow combination."""
         processor = WorkflowProcessor(automation_vault_path=temp_directory)
@@ -690,12 +739,10 @@ class TestWorkflowProcessor:
         assert saved_data["name"] == sample_n8n_workflow.name
         assert len(saved_data["nodes"]) == len(sample_n8n_workflow.nodes)
     
-    def test_process_workflow_complete_pipeline(self, temp_directory, sample_workflow_file):
+    @pytest.mark.parametrize("key_field", ["email", "slack", "sms"])
+    def test_process_workflow_complete_pipeline(self, cached_process_workflow, key_field):
         """Test complete workflow processing pipeline."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        workflow_name = sample_workflow_file.stem
-        processed_workflow = processor.process_workflow(workflow_name, "email")
+        processed_workflow = cached_process_workflow("test_workflow", key_field)
         
         assert isinstance(processed_workflow, N8nWorkflow)
         
@@ -714,148 +761,185 @@ class TestWorkflowProcessor:
 class TestIntegrationErrorHandling:
     """Test error handling across integrations."""
     
-    def test_notion_client_network_error_handling(self, mock_environment_variables):
+    def test_notion_client_network_error_handling(self, patched_notion_client, mock_environment_variables):
         """Test handling of network errors in Notion client."""
-        with patch('src.integrations.notion_client.Client') as mock_client_class:
-            mock_client_instance = Mock()
-            mock_client_class.return_value = mock_client_instance
-            
-            # Simulate network error
-            mock_client_instance.databases.create.side_effect = Exception("Network connection failed")
-            
-            client = NotionClient()
-            database_schema = LibraryDatabase()
-            
-            with pytest.raises(NotionClientError) as exc_info:
-                client.create_database("parent_123", database_schema)
-            
-            assert "Notion operation failed" in str(exc_info.value)
-            assert "Network connection failed" in str(exc_info.value)
+        mock_client_instance = patched_notion_client.return_value
+        
+        # Simulate network error
+        mock_client_instance.databases.create.side_effect = Exception("Network connection failed")
+        
+        client = NotionClient()
+        database_schema = LibraryDatabase()
+        
+        with pytest.raises(NotionClientError) as exc_info:
+            client.create_database("parent_123", database_schema)
+        
+        assert "Notion operation failed" in str(exc_info.value)
+        assert "Network connection failed" in str(exc_info.value)
     
-    def test_workflow_processor_file_system_errors(self, temp_directory):
+    def test_workflow_processor_file_system_errors(self, tmp_path):
         """Test handling of file system errors in workflow processor."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
         # Test with read-only directory (simulated)
         with patch('pathlib.Path.mkdir') as mock_mkdir:
             mock_mkdir.side_effect = PermissionError("Permission denied")
             
             workflow = N8nWorkflow(
                 name="test_workflow",
-                nodes=[],
+                nodes=[_fast_node(0)],
                 connections={}
             )
+            output_path = tmp_path / "test.json"
             
             with pytest.raises(WorkflowProcessorError) as exc_info:
-                processor.save_workflow(workflow, temp_directory / "test.json")
+                WorkflowProcessor._save_workflow_impl(workflow, output_path)
             
             assert "Failed to save workflow" in str(exc_info.value)
+            assert "Permission denied" in str(exc_info.value)
+            assert isinstance(exc_info.value.__context__, PermissionError)
+            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+            assert not output_path.exists()
     
-    def test_concurrent_access_handling(self, mock_environment_variables):
+    def test_concurrent_access_handling(self, patched_notion_client, mock_environment_variables, notion_responses):
         """Test handling of concurrent access scenarios."""
-        with patch('src.integrations.notion_client.Client') as mock_client_class:
-            mock_client_instance = Mock()
-            mock_client_class.return_value = mock_client_instance
-            
-            # Simulate race condition/conflict
-            mock_client_instance.pages.update.side_effect = APIResponseError(
-                response=Mock(status_code=409),
-                message="Conflict - page was modified by another user",
-                code=APIErrorCode.ConflictError
-            )
-            
-            client = NotionClient(max_retries=1)
-            
-            with pytest.raises(APIResponseError):
-                client.update_page("page_123", {"Status": {"select": {"name": "Updated"}}})
-    
-    def test_rate_limiting_scenarios(self, mock_environment_variables):
+        mock_client_instance = patched_notion_client.return_value
+        
+        # Simulate race condition/conflict: 409, then the retried update lands
+        mock_client_instance.pages.update.side_effect = [
+            _api_error("conflict"),
+            notion_responses["pages_update_ok"]
+        ]
+        
+        client = NotionClient(max_retries=1)
+        properties = {"Status": {"select": {"name": "Updated"}}}
+        
+        with patch.object(nc_mod.time, 'sleep') as mock_sleep:
+            response = client.update_page("page_123", properties)
+        
+        assert response == notion_responses["pages_update_ok"]
+        assert mock_client_instance.pages.update.call_count == 2
+        mock_sleep.assert_called_once()  # One backoff round between the attempts
+        mock_client_instance.pages.retrieve.assert_not_called()
+        
+        # Every attempt must re-send the identical write so retries cannot diverge
+        first_call, *retries = mock_client_instance.pages.update.call_args_list
+        assert all(retry == first_call for retry in retries)
+        assert first_call.kwargs == {"page_id": "page_123", "properties": properties}
+        
+        # Persistent contention still surfaces as a client error
+        mock_client_instance.pages.update.side_effect = _raise_api_error("conflict")
+        
+        with patch.object(nc_mod.time, 'sleep'):
+            with pytest.raises(NotionClientError):
+                client.update_page("page_123", properties)
+    
+    @pytest.mark.parametrize("headers, expected_sleeps, rel", [
+        ({}, [0.01, 0.02], 0.5),  # base * 2**attempt, jitter in [0.5, 1.5)
+        ({"Retry-After": "0.05"}, [0.05, 0.05], 0.01),  # Server-dictated Retry-After
+        ({"Retry-After": "-1"}, [0.0, 0.0], 0.01),  # Negative hint clamped to no wait
+        ({"Retry-After": "3600"}, [60.0, 60.0], 0.01),  # Capped at max_delay
+        ({"Retry-After": "nan"}, [0.01, 0.02], 0.5),  # Non-finite hints fall back to backoff
+        ({"Retry-After": "inf"}, [0.01, 0.02], 0.5),
+    ], ids=["exponential_backoff", "retry_after", "retry_after_negative", "retry_after_capped",
+            "retry_after_nan", "retry_after_inf"])
+    def test_rate_limiting_scenarios(self, patched_notion_client, mock_environment_variables, notion_responses,
+                                     headers, expected_sleeps, rel):
         """Test various rate limiting scenarios."""
-        with patch('src.integrations.notion_client.Client') as mock_client_class:
-            mock_client_instance = Mock()
-            mock_client_class.return_value = mock_client_instance
-            
-            # Test exponential backoff with rate limiting
-            rate_limit_error = APIResponseError(
-                response=Mock(status_code=429),
-                message="Rate limited",
-                code=APIErrorCode.RateLimited
-            )
-            
-            mock_client_instance.databases.query.side_effect = [
-                rate_limit_error,
-                rate_limit_error,
-                {"results": []}  # Success on third try
-            ]
-            
-            client = NotionClient(max_retries=2, retry_delay=0.01)
-            
-            with patch('time.sleep'):  # Mock sleep for fast testing
-                results = client.query_database("db_123")
-            
-            assert results == []
-            assert mock_client_instance.databases.query.call_count == 3
+        mock_client_instance = patched_notion_client.return_value
+        
+        # Succeed on the third try after two rate-limited responses
+        mock_client_instance.databases.query.side_effect = [
+            _api_error("rate_limited", headers),
+            _api_error("rate_limited", headers),
+            notion_responses["query_database_empty"]
+        ]
+        
+        client = NotionClient(max_retries=2, retry_delay=0.01)
+        
+        # Capture the backoff delays instead of sleeping
+        sleeps = []
+        with patch.object(nc_mod.time, 'sleep', sleeps.append):
+            results = client.query_database("db_123")
+        
+        assert results == []
+        assert mock_client_instance.databases.query.call_count == 3
+        assert sleeps == pytest.approx(expected_sleeps, rel=rel)
 
 
 class TestIntegrationPerformance:
     """Test performance aspects of integrations."""
     
-    def test_large_dataset_handling(self, mock_environment_variables):
+    @pytest.mark.perf
+    @pytest.mark.xdist_group("perf")
+    def test_large_dataset_handling(self, patched_notion_client, mock_environment_variables):
         """Test handling of large datasets."""
-        with patch('src.integrations.notion_client.Client') as mock_client_class:
-            mock_client_instance = Mock()
-            mock_client_class.return_value = mock_client_instance
+        mock_client_instance = patched_notion_client.return_value
+        
+        with patch.object(nc_mod, 'iterate_paginated_api') as mock_paginated:
+            mock_paginated.return_value = iter(_LARGE_DATASET)
             
-            # Simulate large dataset
-            large_dataset = [{"id": f"page_{i}", "title": f"Page {i}"} for i in range(1000)]
+            client = NotionClient()
+            results = client.query_database("db_123")
             
-            with patch('src.integrations.notion_client.collect_paginated_api') as mock_paginated:
-                mock_paginated.return_value = large_dataset
-                
-                client = NotionClient()
-                results = client.query_database("db_123")
-                
-                assert len(results) == 1000
-                # Verify pagination was used
-                mock_paginated.assert_called_once()
+            assert len(results) == 1000
+            # Verify pagination was used
+            mock_paginated.assert_called_once()
     
-    def test_workflow_processing_performance(self, temp_directory):
-        """Test performance of workflow processing operations."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
-        
-        # Create large workflow
-        large_workflow = N8nWorkflow(
-            name="large_workflow",
-            nodes=[
-                N8nNode(
-                    id=f"node_{i}",
-                    name=f"node_{i}",
-                    type="n8n-nodes-base.set",
-                    position=NodePosition(x=i*100, y=100)
-                )
-                for i in range(50)  # 50 nodes
-            ],
-            connections={}
-        )
+    def test_large_dataset_streaming(self, patched_notion_client, mock_environment_variables):
+        """Test that iterate_database streams pages instead of buffering them."""
+        rows = ({"id": f"page_{i}", "title": f"Page {i}"} for i in range(1000))
         
-        # Time the processing
-        import time
-        start_time = time.time()
-        
-        processed = processor.inject_retry_logic(large_workflow)
-        processed = processor.add_logging_instrumentation(processed)
-        processed = processor.add_error_handling(processed)
+        with patch.object(nc_mod, 'iterate_paginated_api', return_value=rows) as mock_paginated:
+            client = NotionClient()
+            
+            stream = client.iterate_database("db_123")
+            first = next(stream)
+            
+            assert first["id"] == "page_0"
+            # Only the first row was pulled from the source
+            assert next(rows)["id"] == "page_1"
+            # Page fetches go through the retrying wrapper
+            mock_paginated.assert_called_once_with(client._query_page_with_retry, database_id="db_123")
+    
+    @pytest.mark.perf
+    @pytest.mark.xdist_group("perf")
+    @pytest.mark.parametrize("n_nodes", PROCESSING_SIZES)
+    def test_workflow_processing_performance(self, shared_processor, record_property, n_nodes):
+        """Test per-node cost of each workflow processing stage."""
+        # Time each pipeline stage separately, keeping the best of a few runs
+        stage_ns, processed = _time_processing_stages(shared_processor, n_nodes)
+        
+        for stage, ns in stage_ns.items():
+            record_property(f"{stage}_ns", ns)
+        
+        elapsed_ns = sum(stage_ns.values())
+        record_property("ns_per_node", elapsed_ns // n_nodes)
+        
+        # Per-node budget scales with workflow size instead of a fixed wall-clock gate
+        assert elapsed_ns / n_nodes < PER_NODE_THRESHOLD_NS
+        assert len(processed.nodes) > n_nodes  # Original + logging + error nodes
+    
+    @pytest.mark.perf
+    @pytest.mark.xdist_group("perf")
+    def test_workflow_processing_scaling(self, shared_processor, record_property):
+        """Test workflow processing cost grows no faster than linearly with node count."""
+        timings = {
+            n_nodes: sum(_time_processing_stages(shared_processor, n_nodes)[0].values())
+            for n_nodes in PROCESSING_SIZES
+        }
         
-        end_time = time.time()
-        processing_time = end_time - start_time
+        slope, _ = statistics.linear_regression(
+            [math.log(n) for n in PROCESSING_SIZES],
+            [math.log(timings[n]) for n in PROCESSING_SIZES]
+        )
+        record_property("scaling_slope", round(slope, 3))
         
-        # Should process in reasonable time (less than 1 second for 50 nodes)
-        assert processing_time < 1.0
-        assert len(processed.nodes) > 50  # Original + logging + error nodes
+        assert slope < MAX_SCALING_SLOPE, f"Workflow processing scales as O(n^{slope:.2f})"
     
-    def test_memory_efficiency(self, temp_directory):
+    @pytest.mark.perf
+    @pytest.mark.xdist_group("perf")
+    def test_memory_efficiency(self, shared_processor):
         """Test memory efficiency of operations."""
-        processor = WorkflowProcessor(automation_vault_path=temp_directory)
+        processor = shared_processor
         
         # Test that we're not keeping unnecessary references
         workflow = N8nWorkflow(
@@ -865,15 +949,32 @@ class TestIntegrationPerformance:
                 name="test_node", 
                 type="n8n-nodes-base.set",
                 position=NodePosition(x=100, y=100),
-                parameters={"large_data": "x" * 10000}  # 10KB of data
+                parameters={"large_data": _LARGE_DATA}  # 10KB of data
             )],
             connections={}
         )
         
-        # Process workflow multiple times
-        for _ in range(10):
-            processed = processor.inject_retry_logic(workflow)
-            processed = processor.add_logging_instrumentation(processed)
+        # Only count memory allocated by the processor itself
+        processor_only = [tracemalloc.Filter(True, "*n8n_processor.py")]
+        
+        gc.collect()
+        tracemalloc.start()
+        try:
+            snap0 = tracemalloc.take_snapshot().filter_traces(processor_only)
+            growth = []
             
-        # Should not accumulate excessive memory (this is more of a regression test)
-        assert len(processed.nodes) >= 2  # Original + logging node
\ No newline at end of file
+            # Process a fresh copy each time; the stages mutate their input in place
+            for i in range(10):
+                processed = processor.inject_retry_logic(workflow.model_copy(deep=True))
+                processed = processor.add_logging_instrumentation(processed)
+                gc.collect()
+                
+                if i % 2 == 1:
+                    snap = tracemalloc.take_snapshot().filter_traces(processor_only)
+                    stats = snap.compare_to(snap0, "filename")
+                    growth.append(sum(stat.size_diff for stat in stats))
+        finally:
+            tracemalloc.stop()
+        
+        # Retained memory must stay flat (O(1)), not grow with the iteration count
+        assert all(size_diff <= 2 * growth[0] for size_diff in growth)
\ No newline at end of file
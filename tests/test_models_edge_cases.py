@@ -0,0 +1,104 @@
+"""Tests for model edge cases and error conditions."""
+
+import pytest
+from datetime import datetime
+from pydantic import ValidationError
+
+from src.models.package import AutomationPackage
+from src.models.documentation import DocumentationAudience, ImplementationGuide
+
+
+# Oversized document body, built once at import
+_LONG_CONTENT = "a" * 100_000  # 100k characters
+
+
+class TestModelEdgeCases:
+    """Test edge cases and error conditions for all models."""
+    
+    def test_empty_string_validations(self):
+        """Test handling of empty strings in required fields."""
+        with pytest.raises(ValidationError) as exc_info:
+            AutomationPackage.model_validate({
+                "name": "",  # Empty name should fail
+                "slug": "test-slug",
+                "problem_statement": "Test problem", 
+                "roi_notes": "Test ROI"
+            })
+        assert any(e["loc"] == ("name",) and e["type"] == "string_too_short"
+                   for e in exc_info.value.errors(include_url=False))
+    
+    def test_extremely_long_content(self):
+        """Test handling of very long content."""
+        doc = ImplementationGuide.model_validate({
+            "title": "Long Content Test",
+            "audience": DocumentationAudience.TECHNICAL,
+            "package_name": "Test Package",
+            "package_slug": "test-package",
+            "content": _LONG_CONTENT
+        })
+        
+        doc.calculate_metrics()
+        assert doc.word_count > 0
+        assert doc.estimated_read_time > 0
+        
+        # Repeat calls give the same metrics; new content is recounted
+        doc.calculate_metrics()
+        assert doc.word_count == 1
+        assert doc.estimated_read_time == 1
+        doc.content = "two words"
+        doc.calculate_metrics()
+        assert doc.word_count == 2
+    
+    def test_special_characters_in_content(self):
+        """Test handling of special characters and unicode."""
+        special_content = "Content with émojis 🚀 and ñoñ-ASCII chars: 中文"
+        
+        package = AutomationPackage.model_validate({
+            "name": "Special Chars Test",
+            "slug": "special-chars-test",
+            "problem_statement": special_content,
+            "roi_notes": "ROI with special chars: €100k+",
+            "security_notes": special_content
+        })
+        
+        assert package.problem_statement == special_content
+        assert "€" in package.roi_notes
+    
+    def test_datetime_handling(self):
+        """Test datetime field handling."""
+        # Trusted literals: skip validation, default factories still run
+        package = AutomationPackage.model_construct(
+            name="Datetime Test",
+            slug="datetime-test",
+            problem_statement="Test problem",
+            roi_notes="Test ROI"
+        )
+        
+        # Check that timestamps are set
+        assert isinstance(package.created_at, datetime)
+        assert isinstance(package.updated_at, datetime) 
+        assert isinstance(package.last_validated, datetime)
+        
+        # Test metadata dict has ISO format timestamps
+        metadata = package.to_metadata_dict()
+        assert isinstance(metadata["created_at"], str)
+        assert "T" in metadata["created_at"]  # ISO format indicator
+    
+    def test_none_value_handling(self):
+        """Test handling of None values in optional fields."""
+        # Trusted literals: skip validation, default factories still run
+        package = AutomationPackage.model_construct(
+            name="None Test",
+            slug="none-test",
+            problem_statement="Test problem",
+            roi_notes="Test ROI",
+            repo_path=None,  # Optional field
+            n8n_export_path=None  # Optional field
+        )
+        
+        assert package.repo_path is None
+        assert package.n8n_export_path is None
+        
+        # Should still serialize properly
+        metadata = package.to_metadata_dict()
+        assert metadata["repo_path"] is None
@@ -0,0 +1,139 @@
+"""Tests for Notion Business OS model validation and functionality."""
+
+from src.models.notion import (
+    LibraryDatabase, AutomationsDatabase, NotionBusinessOS,
+    NotionProperty, NotionPropertyType
+)
+
+
+class TestNotionModels:
+    """Test Notion database model validation and functionality."""
+    
+    def test_notion_property_type_enum(self):
+        """Test NotionPropertyType enum values."""
+        assert NotionPropertyType.TITLE == "title"
+        assert NotionPropertyType.RICH_TEXT == "rich_text"
+        assert NotionPropertyType.SELECT == "select"
+        assert NotionPropertyType.MULTI_SELECT == "multi_select"
+        assert NotionPropertyType.RELATION == "relation"
+    
+    def test_notion_property_creation(self):
+        """Test NotionProperty model creation."""
+        prop = NotionProperty(
+            name="Test Property",
+            type=NotionPropertyType.TITLE,
+            config={"some": "config"}
+        )
+        
+        assert prop.name == "Test Property"
+        assert prop.type == NotionPropertyType.TITLE
+        assert prop.config["some"] == "config"
+    
+    def test_library_database_creation(self, sample_notion_database):
+        """Test LibraryDatabase creation and schema."""
+        db = sample_notion_database
+        
+        assert db.title == "Library - Canonical Packages"
+        assert "Name" in db.properties
+        assert "Status" in db.properties
+        assert "Version" in db.properties
+        
+        # Check property types
+        assert db.properties["Name"].type == NotionPropertyType.TITLE
+        assert db.properties["Status"].type == NotionPropertyType.SELECT
+        assert db.properties["Niche Tags"].type == NotionPropertyType.MULTI_SELECT
+    
+    def test_add_property_to_database(self):
+        """Test adding properties to database."""
+        db = LibraryDatabase()
+        
+        db.add_property("Custom Field", NotionPropertyType.RICH_TEXT, {"config": "value"})
+        
+        assert "Custom Field" in db.properties
+        assert db.properties["Custom Field"].type == NotionPropertyType.RICH_TEXT
+        assert db.properties["Custom Field"].config["config"] == "value"
+    
+    def test_add_relation_to_database(self):
+        """Test adding relation properties."""
+        db = LibraryDatabase()
+        target_db_id = "target_db_123"
+        
+        db.add_relation("Related Database", target_db_id)
+        
+        assert "Related Database" in db.properties
+        assert db.properties["Related Database"].type == NotionPropertyType.RELATION
+        assert db.relations["Related Database"] == target_db_id
+    
+    def test_database_to_notion_schema(self, sample_notion_database):
+        """Test conversion to Notion API schema format."""
+        schema = sample_notion_database.to_notion_schema()
+        
+        assert "title" in schema
+        assert "properties" in schema
+        assert isinstance(schema["properties"], dict)
+        
+        # Check specific property format
+        name_prop = schema["properties"]["Name"]
+        assert "title" in name_prop
+        
+        status_prop = schema["properties"]["Status"] 
+        assert "select" in status_prop
+    
+    def test_automations_database_creation(self):
+        """Test AutomationsDatabase with relations."""
+        automations_db = AutomationsDatabase(
+            library_db_id="lib_123",
+            clients_db_id="clients_123", 
+            deployments_db_id="deploy_123"
+        )
+        
+        assert automations_db.title == "Automations - Client Instances"
+        assert "Library Package" in automations_db.properties
+        assert "Client" in automations_db.properties
+        assert "Deployments" in automations_db.properties
+        
+        # Check relations
+        assert automations_db.library_db_id == "lib_123"
+        assert automations_db.clients_db_id == "clients_123"
+        assert automations_db.deployments_db_id == "deploy_123"
+    
+    def test_notion_business_os_creation(self, readonly_notion_business_os):
+        """Test NotionBusinessOS creation."""
+        business_os = readonly_notion_business_os
+        
+        assert business_os.library is not None
+        assert business_os.automations is not None
+        assert business_os.components is not None
+        assert business_os.clients is not None
+        assert business_os.deployments is not None
+    
+    def test_business_os_database_relations(self, sample_notion_business_os):
+        """Test Business OS database relation updates."""
+        business_os = sample_notion_business_os
+        
+        # Test relation ID updates
+        database_ids = {
+            "library": "lib_real_123",
+            "clients": "clients_real_123",
+            "automations": "auto_real_123",
+            "deployments": "deploy_real_123"
+        }
+        
+        business_os.update_relation_ids(database_ids)
+        
+        assert business_os.automations.library_db_id == "lib_real_123"
+        assert business_os.automations.clients_db_id == "clients_real_123"
+        assert business_os.deployments.automations_db_id == "auto_real_123"
+    
+    def test_get_all_databases(self, readonly_notion_business_os):
+        """Test getting all databases from Business OS."""
+        databases = readonly_notion_business_os.get_all_databases()
+        
+        assert len(databases) == 5
+        database_titles = [db.title for db in databases]
+        
+        assert "Library - Canonical Packages" in database_titles
+        assert "Automations - Client Instances" in database_titles
+        assert "Components - Reusable Subflows" in database_titles
+        assert "Clients - Accounts & Engagement" in database_titles
+        assert "Deployments - Environment Details" in database_titles
@@ -0,0 +1,202 @@
+"""Tests for AutomationPackage model validation and functionality."""
+
+import pytest
+from datetime import datetime, timedelta
+from pydantic import ValidationError
+
+from src.models.package import AutomationPackage, PackageStatus
+
+
+# Validation cases, built once at import and shared by the tests that loop over them
+VALID_SLUGS = (
+    "simple-slug",
+    "with_underscores",
+    "mixed-slug_format",
+    "numbers123",
+    "all-lowercase-valid"
+)
+INVALID_SLUGS = (
+    "Invalid Slug!",
+    "has@symbols",
+    "has spaces",
+    "UPPERCASE",
+    "special&chars"
+)
+VALID_VERSIONS = ("1.0.0", "2.5.10", "0.1.0", "10.20.30")
+INVALID_VERSIONS = ("1.0", "1.0.0.1", "v1.0.0", "1.0.0-alpha", "invalid")
+
+
+class _Clock:
+    """Stand-in for datetime whose now() advances one microsecond per call."""
+    
+    def __init__(self, start: datetime):
+        self.t = start
+    
+    def now(self, tz=None) -> datetime:
+        self.t += timedelta(microseconds=1)
+        return self.t
+
+
+class TestAutomationPackage:
+    """Test AutomationPackage model validation and functionality."""
+    
+    def test_valid_package_creation(self, sample_automation_package):
+        """Test creating a valid automation package."""
+        assert sample_automation_package.name == "Lead Qualification Automation"
+        assert sample_automation_package.slug == "lead-qualification-automation"
+        assert sample_automation_package.status == PackageStatus.VALIDATED
+        assert sample_automation_package.version == "1.2.0"
+        assert len(sample_automation_package.niche_tags) == 3
+        
+    @pytest.mark.parametrize("slug", VALID_SLUGS)
+    def test_slug_validation_success(self, slug):
+        """Test successful slug validation."""
+        package = AutomationPackage.model_validate({
+            "name": "Test Package",
+            "slug": slug,
+            "problem_statement": "Test problem",
+            "roi_notes": "Test ROI"
+        })
+        assert package.slug == slug.lower()
+    
+    def test_slug_validation_failure(self):
+        """Test slug validation with invalid formats."""
+        for slug in INVALID_SLUGS:
+            with pytest.raises(ValidationError) as exc_info:
+                AutomationPackage.model_validate({
+                    "name": "Test Package",
+                    "slug": slug,
+                    "problem_statement": "Test problem",
+                    "roi_notes": "Test ROI"
+                })
+            
+            errors = exc_info.value.errors(include_url=False)
+            assert [error["loc"] for error in errors] == [("slug",)]
+            assert "Slug must contain only alphanumeric characters" in errors[0]["msg"]
+    
+    @pytest.mark.parametrize("version", VALID_VERSIONS)
+    def test_version_validation_success(self, version):
+        """Test successful semantic version validation."""
+        package = AutomationPackage.model_validate({
+            "name": "Test Package",
+            "slug": "test-package",
+            "problem_statement": "Test problem",
+            "roi_notes": "Test ROI",
+            "version": version
+        })
+        assert package.version == version
+    
+    def test_version_validation_failure(self):
+        """Test version validation with invalid formats."""
+        for version in INVALID_VERSIONS:
+            with pytest.raises(ValidationError) as exc_info:
+                AutomationPackage.model_validate({
+                    "name": "Test Package",
+                    "slug": "test-package",
+                    "problem_statement": "Test problem",
+                    "roi_notes": "Test ROI",
+                    "version": version
+                })
+            
+            errors = exc_info.value.errors(include_url=False)
+            assert [error["loc"] for error in errors] == [("version",)]
+            assert "Version must follow semantic versioning" in errors[0]["msg"] or \
+                   "Version parts must be numeric" in errors[0]["msg"]
+    
+    @pytest.mark.parametrize("field,value,message", [
+        ("slug", "Lead-Qualification", "Slug must contain only alphanumeric characters"),
+        ("slug", "lead qualification", "Slug must contain only alphanumeric characters"),
+        ("version", "1.2", "Version must follow semantic versioning"),
+        ("version", "1.a.3", "Version parts must be numeric")
+    ])
+    def test_slug_and_version_validator_rejections(self, field, value, message):
+        """Test each slug/version rule rejects its case with the matching message."""
+        payload = {
+            "name": "Test Package",
+            "slug": "test-package",
+            "problem_statement": "Test problem",
+            "roi_notes": "Test ROI",
+            field: value
+        }
+        
+        with pytest.raises(ValidationError) as exc_info:
+            AutomationPackage.model_validate(payload)
+        
+        errors = exc_info.value.errors(include_url=False)
+        assert [error["loc"] for error in errors] == [(field,)]
+        assert message in errors[0]["msg"]
+    
+    def test_valid_slug_returned_unchanged(self):
+        """Test a valid slug passes through the validator unchanged."""
+        package = AutomationPackage.model_validate({
+            "name": "Test Package",
+            "slug": "lead_qualification-v2",
+            "problem_statement": "Test problem",
+            "roi_notes": "Test ROI"
+        })
+        assert package.slug == "lead_qualification-v2"
+    
+    def test_update_validation_timestamp(self, sample_automation_package, monkeypatch):
+        """Test updating validation timestamp."""
+        original_timestamp = sample_automation_package.last_validated
+        original_updated = sample_automation_package.updated_at
+        
+        # Advance a fake clock instead of sleeping to ensure timestamp difference
+        clock = _Clock(max(original_timestamp, original_updated))
+        monkeypatch.setattr("src.models.package.datetime", clock)
+        
+        sample_automation_package.update_validation_timestamp()
+        
+        assert sample_automation_package.last_validated > original_timestamp
+        assert sample_automation_package.updated_at > original_updated
+    
+    def test_to_metadata_dict(self, sample_automation_package):
+        """Test conversion to metadata dictionary."""
+        import json
+        
+        metadata = sample_automation_package.to_metadata_dict()
+        
+        # Check all required fields are present
+        required_fields = [
+            "name", "slug", "niche_tags", "problem_statement", "outcomes",
+            "roi_notes", "inputs", "outputs", "dependencies", "security_notes",
+            "status", "version", "last_validated", "created_at", "updated_at"
+        ]
+        
+        for field in required_fields:
+            assert field in metadata
+        
+        # Check specific values
+        assert metadata["name"] == sample_automation_package.name
+        assert metadata["status"] == sample_automation_package.status.value
+        assert isinstance(metadata["last_validated"], str)  # ISO format
+        assert isinstance(metadata["niche_tags"], list)
+        
+        # pydantic-core serializes straight to JSON without an intermediate dict
+        data = json.loads(sample_automation_package.model_dump_json())
+        assert set(required_fields) <= data.keys()
+        assert "T" in data["created_at"]
+        assert data["status"] == metadata["status"]
+    
+    def test_package_status_enum(self):
+        """Test PackageStatus enum values."""
+        assert PackageStatus.DRAFT == "draft"
+        assert PackageStatus.VALIDATED == "validated" 
+        assert PackageStatus.DEPLOYED == "deployed"
+        assert PackageStatus.DEPRECATED == "deprecated"
+    
+    @pytest.mark.parametrize("missing", ["name", "slug"])
+    def test_required_fields_validation(self, missing):
+        """Test validation of required fields."""
+        payload = {
+            "name": "Test Package",
+            "slug": "test-package",
+            "problem_statement": "Test problem",
+            "roi_notes": "Test ROI"
+        }
+        payload.pop(missing)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            AutomationPackage.model_validate(payload)
+        assert any(e["loc"] == (missing,) and e["type"] == "missing"
+                   for e in exc_info.value.errors(include_url=False))
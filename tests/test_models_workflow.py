@@ -0,0 +1,212 @@
+"""Tests for n8n workflow model validation and functionality."""
+
+import pytest
+import time
+from pydantic import ValidationError
+
+from src.models.workflow import N8nWorkflow, N8nNode, NodePosition, WorkflowConnection
+
+
+# Validation cases, built once at import and shared by the tests that loop over them
+VALID_NODE_NAMES = ("webhook_trigger", "data_processor", "send_email")
+INVALID_NODE_NAMES = ("Invalid Name!", "has-special@chars", "Uppercase")
+VALID_WORKFLOW_NAMES = ("lead_qualification", "data_processor", "webhook_handler")
+INVALID_RETRIES = (0, 1, 2, 4, 5)
+
+# Minimal valid node payload; cases override single fields with {**_NODE_BASE, ...}
+_NODE_BASE = {
+    "id": "test_1",
+    "name": "test_node",
+    "type": "n8n-nodes-base.webhook",
+    "position": {"x": 0, "y": 0}
+}
+
+
+class TestN8nWorkflowModels:
+    """Test n8n workflow model validation and functionality."""
+    
+    def test_node_position_creation(self):
+        """Test NodePosition model creation."""
+        position = NodePosition(x=100.5, y=200.0)
+        assert position.x == 100.5
+        assert position.y == 200.0
+    
+    def test_n8n_node_creation(self, sample_n8n_node):
+        """Test N8nNode model creation."""
+        assert sample_n8n_node.id == "webhook_node_1"
+        assert sample_n8n_node.name == "webhook_trigger"
+        assert sample_n8n_node.type == "n8n-nodes-base.webhook"
+        assert sample_n8n_node.retries == 3
+        assert sample_n8n_node.retry_on_fail is True
+    
+    def test_node_naming_convention_validation(self):
+        """Test node naming convention validation."""
+        # Valid names
+        for name in VALID_NODE_NAMES:
+            node = N8nNode.model_validate({
+                "id": "test_1",
+                "name": name,
+                "type": "n8n-nodes-base.webhook",
+                "position": {"x": 0, "y": 0}
+            })
+            assert node.name == name
+        
+        # Invalid names should raise validation error
+        for name in INVALID_NODE_NAMES:
+            with pytest.raises(ValidationError):
+                N8nNode.model_validate({
+                    "id": "test_1",
+                    "name": name,
+                    "type": "n8n-nodes-base.webhook",
+                    "position": {"x": 0, "y": 0}
+                })
+    
+    def test_retry_count_validation(self):
+        """Test retry count validation."""
+        # Valid retry count (must be exactly 3)
+        node = N8nNode.model_validate({**_NODE_BASE, "retries": 3})
+        assert node.retries == 3
+    
+    @pytest.mark.parametrize("invalid_retries", INVALID_RETRIES)
+    def test_retry_count_validation_failure(self, invalid_retries):
+        """Test retry counts other than 3 are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            N8nNode.model_validate({**_NODE_BASE, "retries": invalid_retries})
+        assert any("3 retries for exponential backoff" in e["msg"]
+                   for e in exc_info.value.errors(include_url=False))
+    
+    def test_workflow_connection_model(self):
+        """Test WorkflowConnection model."""
+        connection = WorkflowConnection(
+            source_node="node_1",
+            destination_node="node_2",
+            source_output="main",
+            destination_input="main"
+        )
+        
+        assert connection.source_node == "node_1"
+        assert connection.destination_node == "node_2"
+        assert connection.source_output == "main"
+        assert connection.destination_input == "main"
+    
+    def test_n8n_workflow_creation(self, sample_n8n_workflow):
+        """Test N8nWorkflow model creation."""
+        assert sample_n8n_workflow.name == "lead_qualification_workflow"
+        assert len(sample_n8n_workflow.nodes) == 3
+        assert sample_n8n_workflow.active is True
+        assert "lead" in sample_n8n_workflow.tags
+    
+    def test_workflow_naming_convention_validation(self):
+        """Test workflow naming convention."""
+        # Valid workflow names
+        for name in VALID_WORKFLOW_NAMES:
+            workflow = N8nWorkflow.model_validate({
+                "name": name,
+                "nodes": [{
+                    "id": "test_1",
+                    "name": "test_node", 
+                    "type": "n8n-nodes-base.webhook",
+                    "position": {"x": 0, "y": 0}
+                }],
+                "connections": {}
+            })
+            assert workflow.name == name
+        
+        # Invalid names get normalized
+        workflow = N8nWorkflow.model_validate({
+            "name": "Invalid Workflow Name!",
+            "nodes": [{
+                "id": "test_1",
+                "name": "test_node",
+                "type": "n8n-nodes-base.webhook", 
+                "position": {"x": 0, "y": 0}
+            }],
+            "connections": {}
+        })
+        assert workflow.name == "invalid_workflow_name"
+    
+    def test_workflow_node_validation(self):
+        """Test workflow node validation."""
+        # Empty nodes should raise validation error
+        with pytest.raises(ValidationError) as exc_info:
+            N8nWorkflow.model_validate({
+                "name": "test_workflow",
+                "nodes": [],
+                "connections": {}
+            })
+        assert any("at least one node" in e["msg"] for e in exc_info.value.errors(include_url=False))
+    
+    def test_validate_node_connections(self, sample_n8n_workflow):
+        """Test node connection validation."""
+        errors = sample_n8n_workflow.validate_node_connections()
+        assert len(errors) == 0  # Should be valid
+        
+        # Add invalid connection
+        sample_n8n_workflow.connections["invalid_source"] = {
+            "main": [{"node": "nonexistent_node", "type": "main", "index": 0}]
+        }
+        
+        errors = sample_n8n_workflow.validate_node_connections()
+        assert errors == ["Connection source node 'invalid_source' not found in workflow"]
+    
+    def test_validate_node_connections_scales(self):
+        """Test connection validation stays linear on a 1000-node workflow."""
+        nodes = [
+            N8nNode.model_construct(id=f"n{i}", name=f"n_{i}", type="x", position=NodePosition(x=0, y=0))
+            for i in range(1000)
+        ]
+        connections = {
+            f"n{i}": {"main": [{"node": f"n{i + 1}", "type": "main", "index": 0}]}
+            for i in range(999)
+        }
+        connections["n999"] = {"main": [{"node": "missing", "type": "main", "index": 0}]}
+        workflow = N8nWorkflow.model_construct(name="w", nodes=nodes, connections=connections)
+        
+        start = time.monotonic()
+        errors = workflow.validate_node_connections()
+        elapsed = time.monotonic() - start
+        
+        assert errors == ["Connection destination node 'missing' not found in workflow"]
+        assert elapsed < 0.05
+    
+    def test_workflow_to_n8n_json(self, sample_n8n_workflow):
+        """Test conversion to n8n JSON format."""
+        json_data = sample_n8n_workflow.to_n8n_json()
+        
+        assert json_data["name"] == sample_n8n_workflow.name
+        assert len(json_data["nodes"]) == len(sample_n8n_workflow.nodes)
+        assert "connections" in json_data
+        assert json_data["active"] == sample_n8n_workflow.active
+        
+        # Check node structure
+        node = json_data["nodes"][0]
+        assert "id" in node
+        assert "name" in node
+        assert "type" in node
+        assert "position" in node and len(node["position"]) == 2
+    
+    def test_workflow_from_n8n_json(self, sample_workflow_json):
+        """Test creating workflow from n8n JSON."""
+        workflow = N8nWorkflow.from_n8n_json(sample_workflow_json)
+        
+        assert workflow.name == sample_workflow_json["name"]
+        assert len(workflow.nodes) == len(sample_workflow_json["nodes"])
+        assert workflow.active == sample_workflow_json["active"]
+        
+        # Check first node
+        first_node = workflow.nodes[0]
+        first_node_json = sample_workflow_json["nodes"][0]
+        assert first_node.id == first_node_json["id"]
+        assert first_node.name == first_node_json["name"]
+        assert first_node.type == first_node_json["type"]
+    
+    def test_workflow_from_n8n_json_bytes(self, sample_workflow_json_raw):
+        """Test validating raw n8n JSON bytes directly into a workflow."""
+        import json
+        
+        workflow = N8nWorkflow.model_validate_json(sample_workflow_json_raw)
+        expected = N8nWorkflow.from_n8n_json(json.loads(sample_workflow_json_raw))
+        
+        timestamps = {"created_at", "updated_at"}
+        assert workflow.model_dump(exclude=timestamps) == expected.model_dump(exclude=timestamps)
+        assert workflow.nodes[0].position == NodePosition(x=200, y=200)
@@ -1,23 +1,64 @@
 """Tests for all business module functionality."""
 
 import pytest
-import json
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, mock_open
 from datetime import datetime
 
-from src.modules.niche_research import NicheResearcher, NicheBrief, PainPoint, NicheProfile, NicheResearcherError
-from src.modules.opportunity_mapping import OpportunityMapper, OpportunityMapperError
-from src.modules.assembly import WorkflowAssembler, WorkflowAssemblerError
-from src.modules.validation import WorkflowValidator, ValidationResult, WorkflowValidatorError
-from src.models.package import AutomationPackage, PackageStatus
+from src.modules.niche_research import (
+    NicheResearcher, NicheBrief, PainPoint, NicheResearcherError
+)
+from src.modules.validation import WorkflowValidator, ValidationResult
 from src.models.workflow import N8nWorkflow, N8nNode, NodePosition
 
 
+# Parametrize cases, built once at import
+INDUSTRY_CASES = (
+    ("logistics 3PL", "Transportation & Logistics"),
+    ("real estate management", "Real Estate"),
+    ("healthcare automation", "Healthcare"),
+    ("unknown industry", "General Business")
+)
+# (pain, lowest accepted score, highest accepted score)
+PAIN_IMPACT_CASES = (
+    ({"frequency": "daily", "impact": "high", "mentions": 50}, 0.8, 1.0),
+    ({"frequency": "monthly", "impact": "low", "mentions": 5}, 0.0, 0.5)
+)
+
+# Fixed instant stamped on every ValidationResult built during a test
+_FROZEN_NOW = datetime(2024, 1, 1)
+
+# Pre-serialized vault export, encoded once at import
+_EMPTY_WORKFLOW_JSON = b'{"name": "test", "nodes": [], "connections": {}}'
+
+
+def _concat(results):
+    """Join result messages so each expected substring is one C-level search."""
+    return "\n".join(r.message for r in results)
+
+
+@pytest.fixture(autouse=True)
+def _freeze_clock(monkeypatch):
+    """Freeze the validation clock so results don't read the system time."""
+    monkeypatch.setattr("src.modules.validation._clock", lambda: _FROZEN_NOW)
+
+
 class TestNicheResearcher:
     """Test NicheResearcher module functionality."""
     
+    @pytest.fixture(scope="module")
+    def researcher(self):
+        """Default NicheResearcher shared by the tests that only read from it."""
+        return NicheResearcher()
+    
+    @pytest.fixture(scope="module")
+    def simulated_data(self, researcher):
+        """Simulated research data for "test_niche", generated once; tests only read it."""
+        return researcher._generate_simulated_data("test_niche")
+    
+    @pytest.fixture(scope="module")
+    def simulated_data_logistics(self, researcher):
+        """Simulated research data for "logistics", generated once; tests only read it."""
+        return researcher._generate_simulated_data("logistics")
+    
     def test_niche_researcher_initialization(self):
         """Test NicheResearcher initialization."""
         researcher = NicheResearcher(research_timeout=45, max_sources=3)
@@ -39,15 +80,8 @@ class TestNicheResearcher:
         assert len(result.pain_points) > 0
         assert len(result.opportunities) > 0
     
-    @patch('requests.Session.get')
-    def test_collect_research_data_with_api_calls(self, mock_get):
+    def test_collect_research_data_with_api_calls(self, mock_session_get):
         """Test research data collection with mocked API calls."""
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
-        mock_get.return_value = mock_response
-        
         researcher = NicheResearcher(max_sources=2)
         research_data = researcher._collect_research_data("test_niche")
         
@@ -56,13 +90,10 @@ class TestNicheResearcher:
         assert len(research_data) > 0
         assert "simulated_industry_data" in research_data
     
-    @patch('requests.Session.get')
-    def test_collect_research_data_with_api_failures(self, mock_get):
+    def test_collect_research_data_with_api_failures(self, mock_session_get):
         """Test research data collection when APIs fail."""
         # Mock failed API response
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_session_get.return_value.status_code = 404
         
         researcher = NicheResearcher(max_sources=2)
         research_data = researcher._collect_research_data("test_niche")
@@ -71,11 +102,8 @@ class TestNicheResearcher:
         assert isinstance(research_data, dict)
         assert "simulated_industry_data" in research_data
     
-    def test_generate_simulated_data(self):
+    def test_generate_simulated_data(self, simulated_data):
         """Test simulated data generation."""
-        researcher = NicheResearcher()
-        simulated_data = researcher._generate_simulated_data("test_niche")
-        
         assert "simulated_industry_data" in simulated_data
         assert "simulated_pain_analysis" in simulated_data
         assert "simulated_tech_profile" in simulated_data
@@ -87,12 +115,9 @@ class TestNicheResearcher:
         assert "common_challenges" in industry_data
         assert isinstance(industry_data["common_challenges"], list)
     
-    def test_analyze_niche_profile(self):
+    def test_analyze_niche_profile(self, researcher, simulated_data_logistics):
         """Test niche profile analysis."""
-        researcher = NicheResearcher()
-        test_data = researcher._generate_simulated_data("logistics")
-        
-        profile = researcher._analyze_niche_profile("logistics", test_data)
+        profile = researcher._analyze_niche_profile("logistics", simulated_data_logistics)
         
         assert isinstance(profile, dict)
         assert "niche_name" in profile
@@ -101,12 +126,9 @@ class TestNicheResearcher:
         assert "key_stakeholders" in profile
         assert profile["niche_name"] == "logistics"
     
-    def test_identify_pain_points(self):
+    def test_identify_pain_points(self, researcher, simulated_data):
         """Test pain point identification."""
-        researcher = NicheResearcher()
-        test_data = researcher._generate_simulated_data("test_niche")
-        
-        pain_points = researcher._identify_pain_points(test_data)
+        pain_points = researcher._identify_pain_points(simulated_data)
         
         assert isinstance(pain_points, list)
         assert len(pain_points) > 0
@@ -120,32 +142,14 @@ class TestNicheResearcher:
         assert 0.0 <= pain_point.impact_score <= 1.0
         assert 0.0 <= pain_point.automation_potential <= 1.0
     
-    def test_calculate_pain_impact(self):
+    @pytest.mark.parametrize("pain, low, high", PAIN_IMPACT_CASES, ids=["high_impact", "low_impact"])
+    def test_calculate_pain_impact(self, researcher, pain, low, high):
         """Test pain impact score calculation."""
-        researcher = NicheResearcher()
-        
-        # High impact test case
-        high_impact_pain = {
-            "frequency": "daily",
-            "impact": "high", 
-            "mentions": 50
-        }
-        score = researcher._calculate_pain_impact(high_impact_pain)
-        assert 0.8 <= score <= 1.0
-        
-        # Low impact test case
-        low_impact_pain = {
-            "frequency": "monthly",
-            "impact": "low",
-            "mentions": 5
-        }
-        score = researcher._calculate_pain_impact(low_impact_pain)
-        assert 0.0 <= score <= 0.5
+        score = researcher._calculate_pain_impact(pain)
+        assert low <= score <= high
     
-    def test_map_automation_opportunities(self):
+    def test_map_automation_opportunities(self, researcher):
         """Test automation opportunity mapping."""
-        researcher = NicheResearcher()
-        
         # Create test pain points
         pain_points = [
             PainPoint(
@@ -178,10 +182,8 @@ class TestNicheResearcher:
         assert "automation_type" in opportunity
         assert "roi_estimate" in opportunity
     
-    def test_generate_opportunity_title(self):
+    def test_generate_opportunity_title(self, researcher):
         """Test opportunity title generation."""
-        researcher = NicheResearcher()
-        
         pain_point = PainPoint(
             description="Manual data entry process",
             impact_score=0.8,
@@ -196,10 +198,8 @@ class TestNicheResearcher:
         assert len(title) > 0
         assert "data entry" in title.lower()
     
-    def test_calculate_research_confidence(self):
+    def test_calculate_research_confidence(self, researcher):
         """Test research confidence calculation."""
-        researcher = NicheResearcher()
-        
         # High quality data sources
         high_quality_data = {
             "source1": {"data": "value1"},
@@ -218,6 +218,11 @@ class TestNicheResearcher:
         
         confidence = researcher._calculate_research_confidence(low_quality_data)
         assert 0.0 <= confidence <= 0.6
+        
+        # Confidence depends only on the source shape, not the contents
+        assert confidence == pytest.approx(0.2)  # One source out of five
+        assert researcher._calculate_research_confidence({"source9": {}}) == confidence
+        assert researcher._calculate_research_confidence(high_quality_data) == pytest.approx(1.0)
     
     def test_niche_brief_model_validation(self):
         """Test NicheBrief model validation."""
@@ -235,29 +240,20 @@ class TestNicheResearcher:
         assert len(brief.pain_points) == 1
         assert len(brief.opportunities) == 1
     
-    def test_categorize_industry(self):
+    @pytest.mark.parametrize("niche, expected_category", INDUSTRY_CASES)
+    def test_categorize_industry(self, researcher, niche, expected_category):
         """Test industry categorization."""
-        researcher = NicheResearcher()
-        
-        test_cases = [
-            ("logistics 3PL", "Transportation & Logistics"),
-            ("real estate management", "Real Estate"),
-            ("healthcare automation", "Healthcare"),
-            ("unknown industry", "General Business")
-        ]
-        
-        for niche, expected_category in test_cases:
-            category = researcher._categorize_industry(niche)
-            assert category == expected_category
+        assert researcher._categorize_industry(niche) == expected_category
     
-    def test_error_handling(self):
+    def test_error_handling(self, researcher, monkeypatch):
         """Test error handling in niche research."""
-        researcher = NicheResearcher()
+        def boom(*args, **kwargs):
+            raise Exception("API Error")
         
-        # Test with invalid configuration
-        with patch.object(researcher, '_collect_research_data', side_effect=Exception("API Error")):
-            with pytest.raises(NicheResearcherError):
-                researcher.research_niche("test_niche")
+        # Test with invalid configuration; monkeypatch restores the shared researcher afterwards
+        monkeypatch.setattr(researcher, "_collect_research_data", boom)
+        with pytest.raises(NicheResearcherError):
+            researcher.research_niche("test_niche")
 
 
 class TestOpportunityMapper:
@@ -266,6 +262,8 @@ class TestOpportunityMapper:
     @pytest.fixture
     def sample_opportunity_mapper(self):
         """Sample OpportunityMapper instance."""
+        from src.modules.opportunity_mapping import OpportunityMapper
+        
         return OpportunityMapper()
     
     def test_opportunity_mapper_initialization(self, sample_opportunity_mapper):
@@ -291,20 +289,17 @@ class TestOpportunityMapper:
         assert hasattr(opportunity, 'automation_type')
         assert hasattr(opportunity, 'complexity_level')
         assert hasattr(opportunity, 'roi_estimate')
-    
-    @pytest.mark.skip(reason="assess_complexity method not in OpportunityMapper interface")
-    def test_assess_automation_complexity(self, sample_opportunity_mapper):
-        """Test automation complexity assessment - method not available."""
-        pass
 
 
 class TestWorkflowAssembler:
     """Test WorkflowAssembler module functionality."""
     
     @pytest.fixture
-    def sample_assembler(self, temp_directory):
+    def sample_assembler(self, fake_vault):
         """Sample WorkflowAssembler instance."""
-        return WorkflowAssembler(automation_vault_path=temp_directory)
+        from src.modules.assembly import WorkflowAssembler
+        
+        return WorkflowAssembler(automation_vault_path=fake_vault)
     
     def test_assembler_initialization(self, sample_assembler):
         """Test WorkflowAssembler initialization."""
@@ -317,35 +312,76 @@ class TestWorkflowAssembler:
         """Test getting available workflows from vault."""
         # Create a test workflow file
         test_workflow_path = sample_assembler.vault_path / "test_workflow.json"
-        test_workflow_path.write_text('{"name": "test", "nodes": [], "connections": {}}')
+        test_workflow_path.write_bytes(_EMPTY_WORKFLOW_JSON)
         
         workflows = sample_assembler.get_available_workflows()
         assert isinstance(workflows, list)
         assert "test_workflow" in workflows
-    
-    @pytest.mark.skip(reason="Method not implemented in current WorkflowAssembler")
-    def test_generate_package_structure(self):
-        """Test package directory structure generation - skipped."""
-        pass
-    
-    @pytest.mark.skip(reason="Method not implemented in current WorkflowAssembler")
-    def test_select_workflow_templates(self):
-        """Test workflow template selection - skipped."""
-        pass
-    
-    @pytest.mark.skip(reason="Method not implemented in current WorkflowAssembler")
-    def test_customize_workflow_for_opportunity(self):
-        """Test workflow customization - skipped."""
-        pass
 
 
 class TestWorkflowValidator:
     """Test WorkflowValidator module functionality."""
     
     @pytest.fixture
-    def sample_validator(self, temp_directory):
+    def sample_validator(self, fake_vault):
         """Sample WorkflowValidator instance."""
-        return WorkflowValidator(fixtures_path=temp_directory)
+        return WorkflowValidator(fixtures_path=fake_vault)
+    
+    # Read-only model inputs, built once with model_construct since these tests
+    # exercise the validator rather than Pydantic validation
+    @pytest.fixture(scope="module")
+    def minimal_workflow(self):
+        """Workflow with a single bare webhook node."""
+        return N8nWorkflow.model_construct(
+            name="minimal",
+            nodes=[N8nNode.model_construct(
+                id="test_1",
+                name="test_node",
+                type="n8n-nodes-base.webhook",
+                position=NodePosition.model_construct(x=0, y=0)
+            )],
+            connections={}
+        )
+    
+    @pytest.fixture
+    def sample_results(self):
+        """Two passing and two failing results, stamped by the frozen clock."""
+        return (
+            ValidationResult(True, "schema", "Schema validation passed"),
+            ValidationResult(True, "security", "Security check passed"),
+            ValidationResult(False, "performance", "Performance issue detected"),
+            ValidationResult(False, "logic", "Logic validation failed")
+        )
+    
+    @pytest.fixture(scope="module")
+    def node_with_secrets(self):
+        """Node with only hardcoded secrets (no templating)."""
+        return N8nNode.model_construct(
+            id="test_1",
+            name="test_node",
+            type="n8n-nodes-base.webhook",
+            position=NodePosition.model_construct(x=0, y=0),
+            parameters={
+                "password": "secret123",  # Hardcoded password
+                "token": "hardcoded_token",  # Hardcoded token
+                "api_key": "hardcoded_key"  # No templating in this node
+            }
+        )
+    
+    @pytest.fixture(scope="module")
+    def node_with_env_vars(self):
+        """Node referencing two environment variables plus a literal value."""
+        return N8nNode.model_construct(
+            id="test_1",
+            name="test_node",
+            type="n8n-nodes-base.webhook",
+            position=NodePosition.model_construct(x=0, y=0),
+            parameters={
+                "api_key": "${{ $env.API_KEY }}",
+                "secret": "${{ $env.SECRET_VALUE }}",
+                "hardcoded": "not_an_env_var"
+            }
+        )
     
     def test_validator_initialization(self, sample_validator):
         """Test WorkflowValidator initialization."""
@@ -360,9 +396,9 @@ class TestWorkflowValidator:
         assert "required_error_handling" in rules
         assert "required_retry_logic" in rules
     
-    def test_validate_workflow_success(self, sample_validator, sample_n8n_workflow):
+    def test_validate_workflow_success(self, sample_validator, readonly_n8n_workflow):
         """Test successful workflow validation."""
-        results = sample_validator.validate_workflow(sample_n8n_workflow)
+        results = sample_validator.validate_workflow(readonly_n8n_workflow)
         
         assert isinstance(results, list)
         assert len(results) > 0
@@ -373,49 +409,41 @@ class TestWorkflowValidator:
         assert hasattr(result, 'passed')
         assert hasattr(result, 'level')
         assert hasattr(result, 'message')
-        assert hasattr(result, 'timestamp')
+        assert result.timestamp == _FROZEN_NOW
     
-    @pytest.mark.skip(reason="Cannot create invalid workflow due to Pydantic validation")
-    def test_validate_workflow_with_errors(self, sample_validator):
-        """Test workflow validation with errors - skipped due to model validation."""
-        pass
-    
-    def test_validate_json_schema(self, sample_validator, sample_n8n_workflow):
+    def test_validate_json_schema(self, sample_validator, readonly_n8n_workflow):
         """Test JSON schema validation."""
-        results = sample_validator._validate_json_schema(sample_n8n_workflow)
+        results = sample_validator._validate_json_schema(readonly_n8n_workflow)
         
         # Should pass basic schema validation
-        passed_results = [r for r in results if r.passed]
-        assert len(passed_results) > 0
+        assert any(r.passed for r in results)
         
         # Check specific validations
-        messages = [r.message for r in results]
-        assert any("name is valid" in msg for msg in messages)
-        assert any("Node count is acceptable" in msg for msg in messages)
+        joined = _concat(results)
+        assert "name is valid" in joined
+        assert "Node count is acceptable" in joined
     
-    def test_validate_business_logic(self, sample_validator, sample_n8n_workflow):
+    def test_validate_business_logic(self, sample_validator, readonly_n8n_workflow):
         """Test business logic validation."""
-        results = sample_validator._validate_business_logic(sample_n8n_workflow)
+        results = sample_validator._validate_business_logic(readonly_n8n_workflow)
         
         assert isinstance(results, list)
         assert len(results) > 0
         
         # Check for error handling and retry logic validation
-        messages = [r.message for r in results]
-        logic_messages = [msg for msg in messages if "handling" in msg or "retry" in msg]
-        assert len(logic_messages) > 0
+        joined = _concat(results)
+        assert "handling" in joined or "retry" in joined
     
-    def test_validate_security(self, sample_validator, sample_n8n_workflow):
+    def test_validate_security(self, sample_validator, readonly_n8n_workflow):
         """Test security validation."""
-        results = sample_validator._validate_security(sample_n8n_workflow)
+        results = sample_validator._validate_security(readonly_n8n_workflow)
         
         assert isinstance(results, list)
         assert len(results) > 0
         
         # Should check for hardcoded secrets and env vars
-        messages = [r.message for r in results]
-        security_messages = [msg for msg in messages if "secret" in msg.lower() or "environment" in msg.lower()]
-        assert len(security_messages) > 0
+        joined = _concat(results).lower()
+        assert "secret" in joined or "environment" in joined
     
     def test_validate_package_metadata(self, sample_validator, sample_automation_package):
         """Test package metadata validation."""
@@ -424,11 +452,9 @@ class TestWorkflowValidator:
         assert isinstance(results, list)
         
         # Should validate required fields
-        messages = [r.message for r in results]
-        field_messages = [msg for msg in messages if "field" in msg.lower()]
-        assert len(field_messages) > 0
+        assert "field" in _concat(results).lower()
     
-    def test_simulate_test_run(self, sample_validator, sample_n8n_workflow):
+    def test_simulate_test_run(self, sample_validator, readonly_n8n_workflow):
         """Test workflow test simulation."""
         fixture_data = {
             "test_input": "sample_data",
@@ -436,7 +462,7 @@ class TestWorkflowValidator:
             "company": "Test Company"
         }
         
-        result = sample_validator.simulate_test_run(sample_n8n_workflow, fixture_data)
+        result = sample_validator.simulate_test_run(readonly_n8n_workflow, fixture_data)
         
         assert isinstance(result, ValidationResult)
         assert result.level == "simulation"
@@ -445,39 +471,22 @@ class TestWorkflowValidator:
         assert result.passed
         assert "test inputs" in result.message
     
-    def test_simulate_test_run_failures(self, sample_validator):
+    def test_simulate_test_run_failures(self, sample_validator, minimal_workflow):
         """Test test simulation failures."""
-        # Create minimal workflow with one node (required by validation)
-        minimal_workflow = N8nWorkflow(
-            name="minimal",
-            nodes=[N8nNode(
-                id="test_1",
-                name="test_node",
-                type="n8n-nodes-base.webhook",
-                position=NodePosition(x=0, y=0)
-            )],
-            connections={}
-        )
         result = sample_validator.simulate_test_run(minimal_workflow, {})
         # Should fail due to lack of fixture data
         assert not result.passed
         assert "No fixture data" in result.message
     
-    def test_generate_validation_report(self, sample_validator):
+    def test_generate_validation_report(self, sample_validator, sample_results):
         """Test validation report generation."""
-        results = [
-            ValidationResult(True, "schema", "Schema validation passed"),
-            ValidationResult(True, "security", "Security check passed"),
-            ValidationResult(False, "performance", "Performance issue detected"),
-            ValidationResult(False, "logic", "Logic validation failed")
-        ]
-        
-        report = sample_validator.generate_validation_report(results)
+        report = sample_validator.generate_validation_report(sample_results)
         
         assert isinstance(report, dict)
         assert "summary" in report
         assert "by_level" in report
         assert "generated_at" in report
+        assert all(result.timestamp == _FROZEN_NOW for result in sample_results)
         
         # Check summary
         summary = report["summary"]
@@ -494,22 +503,9 @@ class TestWorkflowValidator:
         assert by_level["schema"]["passed"] == 1
         assert by_level["performance"]["failed"] == 1
     
-    def test_find_hardcoded_secrets(self, sample_validator):
+    def test_find_hardcoded_secrets(self, sample_validator, node_with_secrets):
         """Test hardcoded secret detection."""
-        # Create node with only hardcoded secrets (no templating)
-        node_with_secrets = N8nNode(
-            id="test_1",
-            name="test_node",
-            type="n8n-nodes-base.webhook",
-            position=NodePosition(x=0, y=0),
-            parameters={
-                "password": "secret123",  # Hardcoded password
-                "token": "hardcoded_token",  # Hardcoded token
-                "api_key": "hardcoded_key"  # No templating in this node
-            }
-        )
-        
-        workflow = N8nWorkflow(
+        workflow = N8nWorkflow.model_construct(
             name="test_workflow",
             nodes=[node_with_secrets],
             connections={}
@@ -522,21 +518,9 @@ class TestWorkflowValidator:
         secret_messages = " ".join(secrets)
         assert "password" in secret_messages.lower() or "token" in secret_messages.lower()
     
-    def test_extract_env_variables(self, sample_validator):
+    def test_extract_env_variables(self, sample_validator, node_with_env_vars):
         """Test environment variable extraction."""
-        node_with_env_vars = N8nNode(
-            id="test_1",
-            name="test_node",
-            type="n8n-nodes-base.webhook",
-            position=NodePosition(x=0, y=0),
-            parameters={
-                "api_key": "${{ $env.API_KEY }}",
-                "secret": "${{ $env.SECRET_VALUE }}",
-                "hardcoded": "not_an_env_var"
-            }
-        )
-        
-        workflow = N8nWorkflow(
+        workflow = N8nWorkflow.model_construct(
             name="test_workflow",
             nodes=[node_with_env_vars],
             connections={}
@@ -549,19 +533,19 @@ class TestWorkflowValidator:
         assert "SECRET_VALUE" in env_vars
         assert len(env_vars) == 2
     
-    def test_estimate_execution_time(self, sample_validator, sample_n8n_workflow):
+    def test_estimate_execution_time(self, sample_validator, readonly_n8n_workflow):
         """Test execution time estimation."""
-        estimated_time = sample_validator._estimate_execution_time(sample_n8n_workflow)
+        estimated_time = sample_validator._estimate_execution_time(readonly_n8n_workflow)
         
-        assert isinstance(estimated_time, (int, float))
+        assert type(estimated_time) is float
         assert estimated_time > 0
         # Should be based on node count
-        expected_time = len(sample_n8n_workflow.nodes) * 2.0  # 2 seconds per node
+        expected_time = len(readonly_n8n_workflow.nodes) * 2.0  # 2 seconds per node
         assert estimated_time == expected_time
     
-    def test_identify_integrations(self, sample_validator, sample_n8n_workflow):
+    def test_identify_integrations(self, sample_validator, readonly_n8n_workflow):
         """Test integration identification."""
-        integrations = sample_validator._identify_integrations(sample_n8n_workflow)
+        integrations = sample_validator._identify_integrations(readonly_n8n_workflow)
         
         assert isinstance(integrations, list)
         
@@ -579,6 +563,8 @@ class TestModuleIntegration:
         niche_brief = mock_niche_researcher.research_niche("logistics")
         
         # Map to opportunities
+        from src.modules.opportunity_mapping import OpportunityMapper
+        
         mapper = OpportunityMapper()
         opportunities = mapper.map_opportunities(niche_brief)
         
@@ -589,65 +575,3 @@ class TestModuleIntegration:
             assert hasattr(opportunity, 'title')
             assert hasattr(opportunity, 'automation_type')
             assert len(opportunity.title) > 0
-    
-    def test_opportunity_to_package_assembly_flow(self, temp_directory):
-        """Test flow from opportunity to package assembly."""
-        opportunity = {
-            "title": "CRM Lead Automation",
-            "description": "Automate lead qualification process",
-            "automation_type": "CRM Integration",
-            "complexity": "Medium",
-            "required_integrations": ["HubSpot", "Slack"],
-            "roi_estimate": "High ROI (>300% in 12 months)"
-        }
-        
-        # Skip assembling package as method not available
-        # assembler = WorkflowAssembler(automation_vault_path=temp_directory)
-        # package = assembler.assemble_package(opportunity)
-        return  # Skip this test
-        
-        # Validate assembled package
-        validator = WorkflowValidator()
-        validation_results = validator.validate_package(package)
-        
-        assert len(validation_results) > 0
-        # Should have some passing validations
-        passed_validations = [r for r in validation_results if r.passed]
-        assert len(passed_validations) > 0
-    
-    def test_end_to_end_package_creation_flow(self, temp_directory, mock_niche_researcher):
-        """Test complete end-to-end package creation."""
-        # 1. Research niche
-        niche_brief = mock_niche_researcher.research_niche("sales_automation")
-        
-        # 2. Map opportunities
-        mapper = OpportunityMapper()
-        opportunities = mapper.map_opportunities(niche_brief)
-        best_opportunity = opportunities[0] if opportunities else {
-            "title": "Sales Process Automation",
-            "description": "Automate sales workflows",
-            "automation_type": "Sales",
-            "complexity": "Medium",
-            "required_integrations": ["CRM"],
-            "roi_estimate": "High ROI"
-        }
-        
-        # 3. Skip assembling package as methods not available
-        # assembler = WorkflowAssembler(automation_vault_path=temp_directory)
-        # package = assembler.assemble_package(best_opportunity)
-        # package_path = assembler.generate_package_structure(package)
-        return  # Skip this test
-        
-        # 4. Validate final package
-        validator = WorkflowValidator()
-        validation_results = validator.validate_package(package)
-        
-        # Verify complete package
-        assert package_path.exists()
-        assert (package_path / "metadata.json").exists()
-        assert len(validation_results) > 0
-        
-        # Should have both passed and potentially some failed validations
-        all_passed = all(r.passed for r in validation_results)
-        # Not all validations need to pass for a basic package
-        assert len([r for r in validation_results if r.passed]) > 0
\ No newline at end of file